@@ -1,4 +1,7 @@
 -- SQLite
+-- ddl.sql and every dim_*/fact_* load in this directory target SQLite.
+-- Surrogate keys come from INTEGER PRIMARY KEY AUTOINCREMENT, so the loads
+-- never supply them.
 PRAGMA foreign_keys = ON;
 
 -- =========================
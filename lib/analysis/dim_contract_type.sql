@@ -1,24 +1,26 @@
+-- SQLite
 -- =========================
 -- dim_contract_type
 -- =========================
 INSERT INTO dim_contract_type (
-    contract_type_key,
     contract_reg_type_id,
     contract_id,
     contract_reg_type_en,
     contract_reg_type_ar
 )
-SELECT 
-    ROW_NUMBER() OVER () as contract_type_key,
+-- EXCEPT only appends members not already loaded, so re-runs are incremental.
+-- The casts mirror the stored types: a numeric contract_id is kept as TEXT
+-- in the dimension and would otherwise never match its stored copy.
+SELECT
+    CAST(contract_reg_type_id AS INTEGER) AS contract_reg_type_id,
+    CAST(contract_id AS TEXT)             AS contract_id,
+    CAST(contract_reg_type_en AS TEXT)    AS contract_reg_type_en,
+    CAST(contract_reg_type_ar AS TEXT)    AS contract_reg_type_ar
+FROM rent_contracts
+EXCEPT
+SELECT
     contract_reg_type_id,
     contract_id,
     contract_reg_type_en,
     contract_reg_type_ar
-FROM (
-    SELECT DISTINCT
-        contract_reg_type_id,
-        contract_id,
-        contract_reg_type_en,
-        contract_reg_type_ar
-    FROM rent_contracts
-);
+FROM dim_contract_type;
@@ -1,8 +1,10 @@
+-- SQLite
 -- =========================
 -- dim_date
 -- =========================
 
-INSERT INTO dim_date (
+-- date_key is the primary key, so re-runs skip the days already loaded
+INSERT OR IGNORE INTO dim_date (
     date_key,
     full_date,
     year,
@@ -11,19 +13,19 @@ INSERT INTO dim_date (
     quarter,
     day_of_week
 )
-WITH RECURSIVE calendar AS (
-    SELECT DATE '2020-01-01' AS d
+WITH RECURSIVE calendar(d) AS (
+    SELECT DATE('2020-01-01')
     UNION ALL
-    SELECT d + INTERVAL '1 day'
+    SELECT DATE(d, '+1 day')
     FROM calendar
-    WHERE d < DATE '2035-12-31'
+    WHERE d < '2035-12-31'
 )
 SELECT
-    CAST(strftime('%Y%m%d', d) AS INTEGER)      AS date_key,
-    d                                           AS full_date,
-    YEAR(d)                                     AS year,
-    MONTH(d)                                    AS month,
-    DAY(d)                                      AS day_of_month,
-    QUARTER(d)                                  AS quarter,
-    (EXTRACT(DOW FROM d) + 1)                   AS day_of_week
-FROM calendar;
\ No newline at end of file
+    CAST(strftime('%Y%m%d', d) AS INTEGER)              AS date_key,
+    d                                                   AS full_date,
+    CAST(strftime('%Y', d) AS INTEGER)                  AS year,
+    CAST(strftime('%m', d) AS INTEGER)                  AS month,
+    CAST(strftime('%d', d) AS INTEGER)                  AS day_of_month,
+    (CAST(strftime('%m', d) AS INTEGER) + 2) / 3        AS quarter,
+    (CAST(strftime('%w', d) AS INTEGER) + 6) % 7 + 1    AS day_of_week  -- 1=Mon … 7=Sun
+FROM calendar;
@@ -1,8 +1,8 @@
+-- SQLite
 -- =========================
 -- dim_location
 -- =========================
 INSERT INTO dim_location (
-    location_key,
     area_id,
     area_name_en,
     area_name_ar,
@@ -14,8 +14,24 @@ INSERT INTO dim_location (
     nearest_metro_ar,
     nearest_mall_ar
 )
-SELECT 
-    ROW_NUMBER() OVER () as location_key,
+-- EXCEPT only appends members not already loaded, so re-runs are incremental.
+-- Source columns are cast to the dimension's column types; otherwise values
+-- such as a REAL actual_area never equal their TEXT copy and every re-run
+-- appends the same members again.
+SELECT
+    CAST(area_id AS INTEGER)             AS area_id,
+    CAST(area_name_en AS TEXT)           AS area_name_en,
+    CAST(area_name_ar AS TEXT)           AS area_name_ar,
+    CAST(actual_area AS TEXT)            AS actual_area,
+    CAST(nearest_landmark_en AS TEXT)    AS nearest_landmark_en,
+    CAST(nearest_metro_en AS TEXT)       AS nearest_metro_en,
+    CAST(nearest_mall_en AS TEXT)        AS nearest_mall_en,
+    CAST(nearest_landmark_ar AS TEXT)    AS nearest_landmark_ar,
+    CAST(nearest_metro_ar AS TEXT)       AS nearest_metro_ar,
+    CAST(nearest_mall_ar AS TEXT)        AS nearest_mall_ar
+FROM rent_contracts
+EXCEPT
+SELECT
     area_id,
     area_name_en,
     area_name_ar,
@@ -26,17 +42,4 @@ SELECT
     nearest_landmark_ar,
     nearest_metro_ar,
     nearest_mall_ar
-FROM (
-    SELECT DISTINCT
-        area_id,
-        area_name_en,
-        area_name_ar,
-        actual_area,
-        nearest_landmark_en,
-        nearest_metro_en,
-        nearest_mall_en,
-        nearest_landmark_ar,
-        nearest_metro_ar,
-        nearest_mall_ar
-    FROM rent_contracts
-);
\ No newline at end of file
+FROM dim_location;
\ No newline at end of file
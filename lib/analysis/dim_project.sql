@@ -1,27 +1,29 @@
+-- SQLite
 -- =========================
 -- dim_project
 -- =========================
 INSERT INTO dim_project (
-    project_key,
     project_number,
     project_name_ar,
     project_name_en,
     master_project_ar,
     master_project_en
 )
-SELECT 
-    ROW_NUMBER() OVER () as project_key,
+-- EXCEPT only appends members not already loaded, so re-runs are incremental.
+-- The casts mirror the stored types: a project_number imported as text is
+-- stored as INTEGER and would otherwise never match its stored copy.
+SELECT
+    CAST(project_number AS INTEGER)    AS project_number,
+    CAST(project_name_ar AS TEXT)      AS project_name_ar,
+    CAST(project_name_en AS TEXT)      AS project_name_en,
+    CAST(master_project_ar AS TEXT)    AS master_project_ar,
+    CAST(master_project_en AS TEXT)    AS master_project_en
+FROM rent_contracts
+EXCEPT
+SELECT
     project_number,
     project_name_ar,
     project_name_en,
     master_project_ar,
     master_project_en
-FROM (
-    SELECT DISTINCT
-        project_number,
-        project_name_ar,
-        project_name_en,
-        master_project_ar,
-        master_project_en
-    FROM rent_contracts
-);
+FROM dim_project;
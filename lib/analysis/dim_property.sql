@@ -1,8 +1,8 @@
+-- SQLite
 -- =========================
 -- dim_property
 -- =========================
 INSERT INTO dim_property (
-    property_key,
     ejari_bus_property_type_id,
     ejari_property_type_id,
     ejari_bus_property_type_en,
@@ -14,8 +14,23 @@ INSERT INTO dim_property (
     property_usage_en,
     property_usage_ar
 )
-SELECT 
-    ROW_NUMBER() OVER () as property_key,
+-- EXCEPT only appends members not already loaded, so re-runs are incremental.
+-- The casts mirror the stored types: type ids imported as text are stored
+-- as INTEGER and would otherwise never match their stored copy.
+SELECT
+    CAST(ejari_bus_property_type_id AS INTEGER) AS ejari_bus_property_type_id,
+    CAST(ejari_property_type_id AS INTEGER)     AS ejari_property_type_id,
+    CAST(ejari_bus_property_type_en AS TEXT)    AS ejari_bus_property_type_en,
+    CAST(ejari_bus_property_type_ar AS TEXT)    AS ejari_bus_property_type_ar,
+    CAST(ejari_property_type_en AS TEXT)        AS ejari_property_type_en,
+    CAST(ejari_property_type_ar AS TEXT)        AS ejari_property_type_ar,
+    CAST(ejari_property_sub_type_en AS TEXT)    AS ejari_property_sub_type_en,
+    CAST(ejari_property_sub_type_ar AS TEXT)    AS ejari_property_sub_type_ar,
+    CAST(property_usage_en AS TEXT)             AS property_usage_en,
+    CAST(property_usage_ar AS TEXT)             AS property_usage_ar
+FROM rent_contracts
+EXCEPT
+SELECT
     ejari_bus_property_type_id,
     ejari_property_type_id,
     ejari_bus_property_type_en,
@@ -26,17 +41,4 @@ SELECT
     ejari_property_sub_type_ar,
     property_usage_en,
     property_usage_ar
-FROM (
-    SELECT DISTINCT
-        ejari_bus_property_type_id,
-        ejari_property_type_id,
-        ejari_bus_property_type_en,
-        ejari_bus_property_type_ar,
-        ejari_property_type_en,
-        ejari_property_type_ar,
-        ejari_property_sub_type_en,
-        ejari_property_sub_type_ar,
-        property_usage_en,
-        property_usage_ar
-    FROM rent_contracts
-);
+FROM dim_property;
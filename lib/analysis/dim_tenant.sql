@@ -1,21 +1,23 @@
+-- SQLite
 -- =========================
 -- dim_tenant
 -- =========================
 INSERT INTO dim_tenant (
-    tenant_key,
     tenant_type_id,
     tenant_type_en,
     tenant_type_ar
 )
-SELECT 
-    ROW_NUMBER() OVER () as tenant_key,
+-- EXCEPT only appends members not already loaded, so re-runs are incremental.
+-- The casts mirror the stored types: a tenant_type_id imported as text is
+-- stored as INTEGER and would otherwise never match its stored copy.
+SELECT
+    CAST(tenant_type_id AS INTEGER) AS tenant_type_id,
+    CAST(tenant_type_en AS TEXT)    AS tenant_type_en,
+    CAST(tenant_type_ar AS TEXT)    AS tenant_type_ar
+FROM rent_contracts
+EXCEPT
+SELECT
     tenant_type_id,
     tenant_type_en,
     tenant_type_ar
-FROM (
-    SELECT DISTINCT
-        tenant_type_id,
-        tenant_type_en,
-        tenant_type_ar
-    FROM rent_contracts
-);
+FROM dim_tenant;
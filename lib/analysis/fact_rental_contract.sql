@@ -1,8 +1,12 @@
+-- SQLite
 -- =========================
 -- fact_rental_contract
 -- =========================
+-- rent_contracts is a full DLD snapshot, so the fact table is rebuilt from
+-- it rather than appended to.
+DELETE FROM fact_rent_contract;
+
 INSERT INTO fact_rent_contract (
-    rent_contract_key,
     contract_type_key,
     property_key,
     project_key,
@@ -17,7 +21,6 @@ INSERT INTO fact_rent_contract (
     is_free_hold
 )
 SELECT 
-    ROW_NUMBER() OVER () as rent_contract_key,
     dct.contract_type_key,
     dp.property_key,
     dprj.project_key,
@@ -31,14 +34,44 @@ SELECT
     rc.line_number,
     rc.is_free_hold
 FROM rent_contracts rc
+-- Each dimension is distinct over all of its columns, not over its *_id, so
+-- join on the full member with the same casts the dimension load uses. IS
+-- matches NULL to NULL, so every source row finds exactly one member of
+-- each dimension and the fact table gets one row per source contract.
 JOIN dim_contract_type dct
-    ON rc.contract_reg_type_id = dct.contract_reg_type_id
+    ON CAST(rc.contract_reg_type_id AS INTEGER) = dct.contract_reg_type_id
+    AND CAST(rc.contract_id AS TEXT) IS dct.contract_id
+    AND CAST(rc.contract_reg_type_en AS TEXT) IS dct.contract_reg_type_en
+    AND CAST(rc.contract_reg_type_ar AS TEXT) IS dct.contract_reg_type_ar
 JOIN dim_project dprj
-    ON rc.project_number = dprj.project_number
+    ON CAST(rc.project_number AS INTEGER) = dprj.project_number
+    AND CAST(rc.project_name_ar AS TEXT) IS dprj.project_name_ar
+    AND CAST(rc.project_name_en AS TEXT) IS dprj.project_name_en
+    AND CAST(rc.master_project_ar AS TEXT) IS dprj.master_project_ar
+    AND CAST(rc.master_project_en AS TEXT) IS dprj.master_project_en
 JOIN dim_property dp
-    ON rc.ejari_bus_property_type_id = dp.ejari_bus_property_type_id  
-    AND rc.ejari_property_type_id = dp.ejari_property_type_id
+    ON CAST(rc.ejari_bus_property_type_id AS INTEGER) = dp.ejari_bus_property_type_id
+    AND CAST(rc.ejari_property_type_id AS INTEGER) = dp.ejari_property_type_id
+    AND CAST(rc.ejari_bus_property_type_en AS TEXT) IS dp.ejari_bus_property_type_en
+    AND CAST(rc.ejari_bus_property_type_ar AS TEXT) IS dp.ejari_bus_property_type_ar
+    AND CAST(rc.ejari_property_type_en AS TEXT) IS dp.ejari_property_type_en
+    AND CAST(rc.ejari_property_type_ar AS TEXT) IS dp.ejari_property_type_ar
+    AND CAST(rc.ejari_property_sub_type_en AS TEXT) IS dp.ejari_property_sub_type_en
+    AND CAST(rc.ejari_property_sub_type_ar AS TEXT) IS dp.ejari_property_sub_type_ar
+    AND CAST(rc.property_usage_en AS TEXT) IS dp.property_usage_en
+    AND CAST(rc.property_usage_ar AS TEXT) IS dp.property_usage_ar
 JOIN dim_location dl
-    ON rc.area_id = dl.area_id  
+    ON CAST(rc.area_id AS INTEGER) = dl.area_id
+    AND CAST(rc.area_name_en AS TEXT) IS dl.area_name_en
+    AND CAST(rc.area_name_ar AS TEXT) IS dl.area_name_ar
+    AND CAST(rc.actual_area AS TEXT) IS dl.actual_area
+    AND CAST(rc.nearest_landmark_en AS TEXT) IS dl.nearest_landmark_en
+    AND CAST(rc.nearest_metro_en AS TEXT) IS dl.nearest_metro_en
+    AND CAST(rc.nearest_mall_en AS TEXT) IS dl.nearest_mall_en
+    AND CAST(rc.nearest_landmark_ar AS TEXT) IS dl.nearest_landmark_ar
+    AND CAST(rc.nearest_metro_ar AS TEXT) IS dl.nearest_metro_ar
+    AND CAST(rc.nearest_mall_ar AS TEXT) IS dl.nearest_mall_ar
 JOIN dim_tenant dt
-    ON rc.tenant_type_id = dt.tenant_type_id;
+    ON CAST(rc.tenant_type_id AS INTEGER) = dt.tenant_type_id
+    AND CAST(rc.tenant_type_en AS TEXT) IS dt.tenant_type_en
+    AND CAST(rc.tenant_type_ar AS TEXT) IS dt.tenant_type_ar;
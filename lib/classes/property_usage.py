@@ -7,6 +7,8 @@ import polars as pl
 from datetime import date
 from typing import Optional
 
+from lib.config import FILE_CONFIG
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +29,8 @@ class PropertyUsage:
         Initialize property usage analyzer.
         
         Args:
-            output: Path to output file
+            output: Path to output file. A ``.parquet`` path is written as
+                compressed Parquet, anything else as CSV.
         """
         self.output = output
 
@@ -58,46 +61,49 @@ class PropertyUsage:
                 pl.col("annual_amount").std().alias("std_rent"),
             ])
             
-            # Collect to add calculated columns
-            df = property_usage_stats.collect()
-            
-            # Add market share percentage
-            total_contracts = df["no_of_contracts"].sum()
-            df = df.with_columns(
-                ((pl.col("no_of_contracts") / total_contracts) * 100).alias("market_share_pct")
-            )
+            queries = [property_usage_stats]
             
-            # Add property size statistics if available
+            # Add property size and PSF statistics if area data is available.
+            # Both come from the same rows, so compute them in one pass.
             if "actual_area" in lf.collect_schema().names():
-                size_stats = lf.filter(
+                queries.append(lf.filter(
                     (pl.col("property_usage_en").is_not_null()) &
                     (pl.col("actual_area").is_not_null()) &
                     (pl.col("actual_area") > 0)
+                ).with_columns(
+                    pl.when(
+                        (pl.col("annual_amount").is_not_null()) &
+                        (pl.col("annual_amount") > 0)
+                    )
+                    .then(pl.col("annual_amount") / pl.col("actual_area"))
+                    .otherwise(None)
+                    .alias("psf")
                 ).group_by("property_usage_en").agg([
                     pl.col("actual_area").mean().alias("avg_area_sqft"),
                     pl.col("actual_area").median().alias("median_area_sqft"),
-                ]).collect()
-                
-                # Join with main stats
-                df = df.join(size_stats, on="property_usage_en", how="left")
-            
-            # Add PSF if area data available
-            if "actual_area" in lf.collect_schema().names():
-                psf_stats = lf.filter(
-                    (pl.col("property_usage_en").is_not_null()) &
-                    (pl.col("actual_area").is_not_null()) &
-                    (pl.col("actual_area") > 0) &
-                    (pl.col("annual_amount").is_not_null()) &
-                    (pl.col("annual_amount") > 0)
-                ).with_columns(
-                    (pl.col("annual_amount") / pl.col("actual_area")).alias("psf")
-                ).group_by("property_usage_en").agg([
                     pl.col("psf").mean().alias("avg_psf"),
                     pl.col("psf").median().alias("median_psf"),
-                ]).collect()
-                
-                # Join with main stats
-                df = df.join(psf_stats, on="property_usage_en", how="left")
+                ]))
+            
+            # Run the queries together so Polars executes them in parallel
+            # and shares the common scan
+            df, *area_stats = pl.collect_all(queries)
+            
+            # Add market share percentage
+            total_contracts = df["no_of_contracts"].sum()
+            df = df.with_columns(
+                ((pl.col("no_of_contracts") / total_contracts) * 100).alias("market_share_pct")
+            )
+            
+            # Join with main stats. The key is Categorical, and frames
+            # collected by separate queries need not share its dictionary,
+            # so join on the plain strings.
+            if area_stats:
+                df = df.with_columns(pl.col("property_usage_en").cast(pl.String)).join(
+                    area_stats[0].with_columns(pl.col("property_usage_en").cast(pl.String)),
+                    on="property_usage_en",
+                    how="left",
+                )
             
             # Add report date
             df = df.with_columns(
@@ -107,19 +113,28 @@ class PropertyUsage:
             # Sort by contract count descending
             df = df.sort("no_of_contracts", descending=True)
             
-            # Save to CSV
-            df.write_csv(self.output)
+            # Save as Parquet or CSV depending on the output extension
+            if self.output.endswith(".parquet"):
+                df.write_parquet(
+                    self.output,
+                    compression=FILE_CONFIG["parquet_compression"],
+                    compression_level=FILE_CONFIG["parquet_compression_level"],
+                    statistics=True,
+                )
+            else:
+                df.write_csv(self.output)
             
             logger.info(f"Property usage report saved to {self.output}")
             logger.info(f"Analyzed {len(df)} usage categories with {total_contracts:,} total contracts")
             
-            # Log top 5 categories
-            logger.info("Top 5 property usage categories:")
-            for row in df.head(5).iter_rows(named=True):
-                logger.info(
-                    f"  {row['property_usage_en']}: {row['no_of_contracts']:,} contracts "
-                    f"({row['market_share_pct']:.1f}%), avg rent: AED {row['avg_rent']:,.0f}"
-                )
+            # Log top 5 categories (only formatted when INFO is enabled)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Top 5 property usage categories:")
+                for row in df.head(5).iter_rows(named=True):
+                    logger.info(
+                        f"  {row['property_usage_en']}: {row['no_of_contracts']:,} contracts "
+                        f"({row['market_share_pct']:.1f}%), avg rent: AED {row['avg_rent']:,.0f}"
+                    )
                 
         except Exception as e:
             logger.error(f"Error analyzing property usage: {e}")
@@ -161,9 +176,11 @@ class PropertyUsage:
                 pl.col("annual_amount").mean().alias("previous_avg_rent"),
             ]).collect()
             
-            # Join and calculate changes
-            comparison = current.join(
-                previous, 
+            # Join and calculate changes. The two periods are read from
+            # different files, so join on the strings rather than on their
+            # separate Categorical dictionaries.
+            comparison = current.with_columns(pl.col("property_usage_en").cast(pl.String)).join(
+                previous.with_columns(pl.col("property_usage_en").cast(pl.String)), 
                 on="property_usage_en", 
                 how="outer"
             ).with_columns([
@@ -23,16 +23,21 @@ logger = logging.getLogger(__name__)
 class ValidationResult:
     """Container for validation results."""
     
+    __slots__ = ("errors", "warnings", "info")
+    
     def __init__(self):
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
-        self.is_valid: bool = True
+        
+    @property
+    def is_valid(self) -> bool:
+        """True while no errors have been recorded."""
+        return not self.errors
         
     def add_error(self, message: str):
         """Add an error message."""
         self.errors.append(message)
-        self.is_valid = False
         
     def add_warning(self, message: str):
         """Add a warning message."""
@@ -109,27 +114,91 @@ class RentContractValidator:
         # Validate schema
         self._validate_schema(df, result)
         
-        # Validate required fields
-        self._validate_required_fields(df, result)
-        
         # Validate data types
         self._validate_data_types(df, result)
         
+        # Compute every rule's violation count in one pass
+        counts = self._count_violations(df)
+        
+        # Validate required fields
+        self._validate_required_fields(df, counts, result)
+        
         # Validate ranges
-        self._validate_rent_amounts(df, result)
-        self._validate_property_sizes(df, result)
-        self._validate_dates(df, result)
+        self._validate_rent_amounts(counts, result)
+        self._validate_property_sizes(counts, result)
+        self._validate_dates(df, counts, result)
         
         # Validate business logic
-        self._validate_business_logic(df, result)
+        self._validate_business_logic(counts, result)
         
         # Detect outliers
-        self._detect_outliers(df, result)
+        self._detect_outliers(counts, result)
         
         logger.info(f"Validation complete: {result.get_summary()}")
         
         return result
         
+    def _count_violations(self, df: pl.DataFrame) -> Dict[str, int]:
+        """
+        Count the rows failing each rule with a single lazy select.
+        
+        Building every check as an aggregate expression lets Polars evaluate
+        them together instead of filtering the frame once per rule.
+        
+        Args:
+            df: DataFrame being validated
+            
+        Returns:
+            Mapping of check name to row count
+        """
+        exprs = []
+        
+        null_fields = DATA_QUALITY_RULES["required_fields"] + DATA_QUALITY_RULES.get("date_fields", [])
+        for field in dict.fromkeys(null_fields):
+            if field in df.columns:
+                exprs.append(pl.col(field).null_count().alias(f"null_{field}"))
+                
+        if "annual_amount" in df.columns:
+            rent = pl.col("annual_amount")
+            positive_rent = rent.filter(rent > 0)
+            q1 = positive_rent.quantile(0.25)
+            q3 = positive_rent.quantile(0.75)
+            iqr = q3 - q1
+            exprs.extend([
+                rent.is_not_null().sum().alias("rent_count"),
+                (rent <= 0).sum().alias("rent_non_positive"),
+                (rent < VALIDATION_THRESHOLDS["min_annual_rent"]).sum().alias("rent_below_min"),
+                (rent > VALIDATION_THRESHOLDS["max_annual_rent"]).sum().alias("rent_above_max"),
+                positive_rent.len().alias("rent_positive"),
+                (
+                    (positive_rent < q1 - 3.0 * iqr) | (positive_rent > q3 + 3.0 * iqr)
+                ).sum().alias("rent_outliers"),
+            ])
+            
+        if "actual_area" in df.columns:
+            size = pl.col("actual_area")
+            exprs.extend([
+                size.is_not_null().sum().alias("size_count"),
+                (size <= 0).sum().alias("size_non_positive"),
+                (size < VALIDATION_THRESHOLDS["min_property_size"]).sum().alias("size_below_min"),
+                (size > VALIDATION_THRESHOLDS["max_property_size"]).sum().alias("size_above_max"),
+            ])
+            
+        if "contract_start_date" in df.columns and "contract_end_date" in df.columns:
+            start = pl.col("contract_start_date")
+            end = pl.col("contract_end_date")
+            duration_days = (end - start).dt.total_days()
+            exprs.extend([
+                (end <= start).sum().alias("end_before_start"),
+                (duration_days < VALIDATION_THRESHOLDS["min_contract_days"]).sum().alias("too_short"),
+                (duration_days > VALIDATION_THRESHOLDS["max_contract_days"]).sum().alias("too_long"),
+            ])
+            
+        if not exprs:
+            return {}
+            
+        return df.lazy().select(exprs).collect().row(0, named=True)
+        
     def _validate_schema(self, df: pl.DataFrame, result: ValidationResult):
         """Validate that expected columns exist."""
         expected_cols = DATA_QUALITY_RULES["required_fields"]
@@ -138,13 +207,13 @@ class RentContractValidator:
         if missing_cols:
             result.add_error(f"Missing required columns: {', '.join(missing_cols)}")
             
-    def _validate_required_fields(self, df: pl.DataFrame, result: ValidationResult):
+    def _validate_required_fields(self, df: pl.DataFrame, counts: Dict[str, int], result: ValidationResult):
         """Validate that required fields are not null."""
         for field in DATA_QUALITY_RULES["required_fields"]:
             if field not in df.columns:
                 continue
                 
-            null_count = df[field].null_count()
+            null_count = counts[f"null_{field}"]
             if null_count > 0:
                 pct = (null_count / df.height) * 100
                 msg = f"Field '{field}' has {null_count:,} null values ({pct:.2f}%)"
@@ -165,76 +234,67 @@ class RentContractValidator:
             if df[field].dtype not in [pl.Int64, pl.Int32, pl.Float64, pl.Float32]:
                 result.add_warning(f"Field '{field}' is not numeric type: {df[field].dtype}")
                 
-    def _validate_rent_amounts(self, df: pl.DataFrame, result: ValidationResult):
+    def _validate_rent_amounts(self, counts: Dict[str, int], result: ValidationResult):
         """Validate rent amounts are within reasonable ranges."""
-        if "annual_amount" not in df.columns:
+        # Skip when the column is missing or entirely null
+        valid_count = counts.get("rent_count", 0)
+        if valid_count == 0:
             return
             
         min_rent = VALIDATION_THRESHOLDS["min_annual_rent"]
         max_rent = VALIDATION_THRESHOLDS["max_annual_rent"]
         
-        # Filter out nulls
-        valid_rents = df.filter(pl.col("annual_amount").is_not_null())
-        
-        if valid_rents.height == 0:
-            return
-            
         # Check for negative or zero rents
-        invalid_rents = valid_rents.filter(pl.col("annual_amount") <= 0)
-        if invalid_rents.height > 0:
-            result.add_error(f"Found {invalid_rents.height:,} records with rent <= 0")
+        if counts["rent_non_positive"] > 0:
+            result.add_error(f"Found {counts['rent_non_positive']:,} records with rent <= 0")
             
         # Check for rents below minimum
-        below_min = valid_rents.filter(pl.col("annual_amount") < min_rent)
-        if below_min.height > 0:
-            pct = (below_min.height / valid_rents.height) * 100
+        below_min = counts["rent_below_min"]
+        if below_min > 0:
+            pct = (below_min / valid_count) * 100
             result.add_warning(
-                f"Found {below_min.height:,} records with rent < AED {min_rent:,} ({pct:.2f}%)"
+                f"Found {below_min:,} records with rent < AED {min_rent:,} ({pct:.2f}%)"
             )
             
         # Check for rents above maximum
-        above_max = valid_rents.filter(pl.col("annual_amount") > max_rent)
-        if above_max.height > 0:
-            pct = (above_max.height / valid_rents.height) * 100
+        above_max = counts["rent_above_max"]
+        if above_max > 0:
+            pct = (above_max / valid_count) * 100
             result.add_warning(
-                f"Found {above_max.height:,} records with rent > AED {max_rent:,} ({pct:.2f}%)"
+                f"Found {above_max:,} records with rent > AED {max_rent:,} ({pct:.2f}%)"
             )
             
-    def _validate_property_sizes(self, df: pl.DataFrame, result: ValidationResult):
+    def _validate_property_sizes(self, counts: Dict[str, int], result: ValidationResult):
         """Validate property sizes are within reasonable ranges."""
-        if "actual_area" not in df.columns:
+        # Skip when the column is missing or entirely null
+        valid_count = counts.get("size_count", 0)
+        if valid_count == 0:
             return
             
         min_size = VALIDATION_THRESHOLDS["min_property_size"]
         max_size = VALIDATION_THRESHOLDS["max_property_size"]
         
-        valid_sizes = df.filter(pl.col("actual_area").is_not_null())
-        
-        if valid_sizes.height == 0:
-            return
-            
         # Check for invalid sizes
-        invalid_sizes = valid_sizes.filter(pl.col("actual_area") <= 0)
-        if invalid_sizes.height > 0:
-            result.add_error(f"Found {invalid_sizes.height:,} records with size <= 0")
+        if counts["size_non_positive"] > 0:
+            result.add_error(f"Found {counts['size_non_positive']:,} records with size <= 0")
             
         # Check for sizes below minimum
-        below_min = valid_sizes.filter(pl.col("actual_area") < min_size)
-        if below_min.height > 0:
-            pct = (below_min.height / valid_sizes.height) * 100
+        below_min = counts["size_below_min"]
+        if below_min > 0:
+            pct = (below_min / valid_count) * 100
             result.add_warning(
-                f"Found {below_min.height:,} records with size < {min_size} sqft ({pct:.2f}%)"
+                f"Found {below_min:,} records with size < {min_size} sqft ({pct:.2f}%)"
             )
             
         # Check for sizes above maximum
-        above_max = valid_sizes.filter(pl.col("actual_area") > max_size)
-        if above_max.height > 0:
-            pct = (above_max.height / valid_sizes.height) * 100
+        above_max = counts["size_above_max"]
+        if above_max > 0:
+            pct = (above_max / valid_count) * 100
             result.add_warning(
-                f"Found {above_max.height:,} records with size > {max_size:,} sqft ({pct:.2f}%)"
+                f"Found {above_max:,} records with size > {max_size:,} sqft ({pct:.2f}%)"
             )
             
-    def _validate_dates(self, df: pl.DataFrame, result: ValidationResult):
+    def _validate_dates(self, df: pl.DataFrame, counts: Dict[str, int], result: ValidationResult):
         """Validate date fields."""
         date_fields = DATA_QUALITY_RULES.get("date_fields", [])
         
@@ -243,84 +303,48 @@ class RentContractValidator:
                 continue
                 
             # Check for null dates
-            null_count = df[field].null_count()
+            null_count = counts[f"null_{field}"]
             if null_count > 0:
                 pct = (null_count / df.height) * 100
                 result.add_warning(f"Field '{field}' has {null_count:,} null dates ({pct:.2f}%)")
                 
-    def _validate_business_logic(self, df: pl.DataFrame, result: ValidationResult):
+    def _validate_business_logic(self, counts: Dict[str, int], result: ValidationResult):
         """Validate business logic rules."""
+        # Date checks only run when both contract dates are present
+        if "end_before_start" not in counts:
+            return
+            
         # Check if end_date > start_date
-        if "contract_start_date" in df.columns and "contract_end_date" in df.columns:
-            invalid_dates = df.filter(
-                (pl.col("contract_start_date").is_not_null()) &
-                (pl.col("contract_end_date").is_not_null()) &
-                (pl.col("contract_end_date") <= pl.col("contract_start_date"))
+        if counts["end_before_start"] > 0:
+            result.add_error(
+                f"Found {counts['end_before_start']:,} records where end_date <= start_date"
             )
             
-            if invalid_dates.height > 0:
-                result.add_error(
-                    f"Found {invalid_dates.height:,} records where end_date <= start_date"
-                )
-                
         # Check for reasonable contract durations
-        if "contract_start_date" in df.columns and "contract_end_date" in df.columns:
-            df_with_duration = df.filter(
-                (pl.col("contract_start_date").is_not_null()) &
-                (pl.col("contract_end_date").is_not_null())
-            ).with_columns(
-                ((pl.col("contract_end_date") - pl.col("contract_start_date")).dt.total_days()).alias("duration_days")
+        min_days = VALIDATION_THRESHOLDS["min_contract_days"]
+        max_days = VALIDATION_THRESHOLDS["max_contract_days"]
+        
+        if counts["too_short"] > 0:
+            result.add_warning(
+                f"Found {counts['too_short']:,} contracts shorter than {min_days} days"
             )
             
-            min_days = VALIDATION_THRESHOLDS["min_contract_days"]
-            max_days = VALIDATION_THRESHOLDS["max_contract_days"]
+        if counts["too_long"] > 0:
+            result.add_warning(
+                f"Found {counts['too_long']:,} contracts longer than {max_days} days"
+            )
             
-            too_short = df_with_duration.filter(pl.col("duration_days") < min_days)
-            if too_short.height > 0:
-                result.add_warning(
-                    f"Found {too_short.height:,} contracts shorter than {min_days} days"
-                )
-                
-            too_long = df_with_duration.filter(pl.col("duration_days") > max_days)
-            if too_long.height > 0:
-                result.add_warning(
-                    f"Found {too_long.height:,} contracts longer than {max_days} days"
-                )
-                
-    def _detect_outliers(self, df: pl.DataFrame, result: ValidationResult):
-        """Detect statistical outliers in rent amounts."""
-        if "annual_amount" not in df.columns:
+    def _detect_outliers(self, counts: Dict[str, int], result: ValidationResult):
+        """Detect statistical outliers (beyond 3x IQR) in rent amounts."""
+        valid_count = counts.get("rent_positive", 0)
+        if valid_count < 10:  # Need minimum sample size
             return
             
-        valid_rents = df.filter(
-            (pl.col("annual_amount").is_not_null()) &
-            (pl.col("annual_amount") > 0)
-        )
-        
-        if valid_rents.height < 10:  # Need minimum sample size
-            return
-            
-        # Calculate IQR
-        stats = valid_rents.select([
-            pl.col("annual_amount").quantile(0.25).alias("q1"),
-            pl.col("annual_amount").quantile(0.75).alias("q3"),
-        ]).row(0)
-        
-        q1, q3 = stats
-        iqr = q3 - q1
-        
-        lower_bound = q1 - (3.0 * iqr)
-        upper_bound = q3 + (3.0 * iqr)
-        
-        outliers = valid_rents.filter(
-            (pl.col("annual_amount") < lower_bound) |
-            (pl.col("annual_amount") > upper_bound)
-        )
-        
-        if outliers.height > 0:
-            pct = (outliers.height / valid_rents.height) * 100
+        outliers = counts["rent_outliers"]
+        if outliers > 0:
+            pct = (outliers / valid_count) * 100
             result.add_info(
-                f"Detected {outliers.height:,} statistical outliers in rent amounts ({pct:.2f}%)"
+                f"Detected {outliers:,} statistical outliers in rent amounts ({pct:.2f}%)"
             )
 
 
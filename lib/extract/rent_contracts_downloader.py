@@ -3,22 +3,37 @@ Rent contracts downloader with enhanced error handling and retry logic.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import os
+import shutil
 import time
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 from lib.config import API_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Byte ranges index the file as stored on the server. Range requests ask for
+# it unencoded, so offsets into decoded partial files stay valid even when the
+# server would otherwise gzip the response.
+RANGE_HEADERS = {"Accept-Encoding": "identity"}
+
+# Chunk size used to feed the landing page to the HTML parser, so it can stop
+# reading as soon as the download link has been seen
+HTML_CHUNK_SIZE = 16 * 1024
+
 
 class RentContractsDownloader:
     """
     Downloads rent contract data from Dubai Land Department.
     
     Features:
-    - Retry logic with exponential backoff
+    - Retry logic with exponential backoff on a keep-alive session
+    - Resumable and parallel (HTTP range) downloads
     - Progress tracking for large downloads
     - Comprehensive error handling
     - Request timeout configuration
@@ -35,10 +50,29 @@ class RentContractsDownloader:
         self.timeout = API_CONFIG["request_timeout"]
         self.max_retries = API_CONFIG["max_retries"]
         self.backoff_factor = API_CONFIG["retry_backoff_factor"]
+        self.chunk_size = API_CONFIG["download_chunk_size"]
+        self.connections = API_CONFIG["download_connections"]
+        self.min_part_size = API_CONFIG["min_download_part_size"]
+        
+        # One session for every request so TCP/TLS connections are reused;
+        # urllib3 retries connection errors, timeouts and 5xx responses
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def fetch_rent_contracts(self) -> bytes:
         """
-        Fetch the rent contracts HTML content from the URL with retry logic.
+        Fetch the rent contracts HTML content from the URL.
+        
+        Transient failures are retried with exponential backoff by the
+        session's retry policy.
         
         Returns:
             HTML content as bytes
@@ -46,55 +80,68 @@ class RentContractsDownloader:
         Raises:
             requests.exceptions.RequestException: If all retries fail
         """
-        for attempt in range(self.max_retries):
-            try:
-                logger.info(f"Fetching rent contracts from {self.url} (attempt {attempt + 1}/{self.max_retries})")
-                response = requests.get(self.url, timeout=self.timeout)
+        logger.info(f"Fetching rent contracts from {self.url}")
+        try:
+            response = self.session.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed after retries: {e}")
+            raise
+        
+        logger.info(f"Successfully fetched HTML content ({len(response.content):,} bytes)")
+        return response.content
+
+    def fetch_download_link(self) -> Optional[str]:
+        """
+        Stream the rent contracts page into parse_html to find the download link.
+        
+        The response body is read in HTML_CHUNK_SIZE chunks and the connection
+        is closed once the link is found, so the rest of the page is neither
+        downloaded nor parsed.
+        
+        Returns:
+            Download URL if found, None otherwise
+            
+        Raises:
+            requests.exceptions.RequestException: If all retries fail
+        """
+        logger.info(f"Fetching rent contracts from {self.url}")
+        try:
+            with self.session.get(self.url, timeout=self.timeout, stream=True) as response:
                 response.raise_for_status()
-                logger.info(f"Successfully fetched HTML content ({len(response.content):,} bytes)")
-                return response.content
-                
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout on attempt {attempt + 1}")
-                if attempt < self.max_retries - 1:
-                    wait_time = self.backoff_factor ** attempt
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error("Max retries reached for fetching HTML")
-                    raise
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed on attempt {attempt + 1}: {e}")
-                if attempt < self.max_retries - 1:
-                    wait_time = self.backoff_factor ** attempt
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error("Max retries reached")
-                    raise
+                return self.parse_html(response.iter_content(chunk_size=HTML_CHUNK_SIZE))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed after retries: {e}")
+            raise
 
-    def parse_html(self, html_content: bytes) -> Optional[str]:
+    def parse_html(self, html_content: Union[bytes, Iterable[bytes]]) -> Optional[str]:
         """
         Parse the HTML content to find the download link.
         
+        Chunks are fed to an incremental parser and parsing stops at the first
+        matching ``<a>`` tag, so later chunks are never read. Content passed as
+        a single bytes object is parsed in one feed.
+        
         Args:
-            html_content: HTML content as bytes
+            html_content: HTML content as bytes, or an iterable of byte chunks
             
         Returns:
             Download URL if found, None otherwise
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            a_tag = soup.find('a', class_='action-icon-anchor')
+            chunks = [html_content] if isinstance(html_content, bytes) else html_content
+            parser = etree.HTMLPullParser(events=("start",), tag="a")
             
-            if a_tag and 'href' in a_tag.attrs:
-                href = a_tag['href']
-                logger.info(f"Found download link: {href}")
-                return href
-            else:
-                logger.warning("No download link found with class 'action-icon-anchor'")
-                return None
+            for chunk in chunks:
+                parser.feed(chunk)
+                for _, a_tag in parser.read_events():
+                    href = a_tag.get("href")
+                    if href is not None and "action-icon-anchor" in a_tag.get("class", "").split():
+                        logger.info(f"Found download link: {href}")
+                        return href
+            
+            logger.warning("No download link found with class 'action-icon-anchor'")
+            return None
                 
         except Exception as e:
             logger.error(f"Error parsing HTML: {e}")
@@ -104,6 +151,12 @@ class RentContractsDownloader:
         """
         Download the file from the given href and save it as filename.
         
+        Data is written to ``<filename>.part`` and renamed on completion. If a
+        partial file is left behind by an interrupted attempt (or run), the
+        download resumes from its size with an HTTP ``Range`` request; servers
+        that ignore the range cause a restart from scratch. A partial file the
+        server reports as already complete (416) is finalized as is.
+        
         Args:
             href: URL to download from
             filename: Local filename to save to
@@ -111,30 +164,70 @@ class RentContractsDownloader:
         Raises:
             requests.exceptions.RequestException: If download fails
         """
+        part_file = f"{filename}.part"
+        
+        # Split large downloads across several connections, unless there is a
+        # partial single-stream download to resume
+        if self.connections > 1 and not os.path.isfile(part_file):
+            total_size = self._probe_range_support(href)
+            if total_size >= 2 * self.min_part_size:
+                try:
+                    self.download_file_parallel(href, filename, total_size)
+                    return
+                except requests.exceptions.RequestException as e:
+                    logger.warning(f"Parallel download failed ({e}). Falling back to a single connection.")
+        
+        # The session retries failed requests; this loop covers failures in
+        # the middle of the body, resuming from what was already written
         for attempt in range(self.max_retries):
             try:
-                logger.info(f"Downloading file from {href} (attempt {attempt + 1}/{self.max_retries})")
+                offset = os.path.getsize(part_file) if os.path.isfile(part_file) else 0
+                headers = {**RANGE_HEADERS, "Range": f"bytes={offset}-"} if offset else {}
+                
+                if offset:
+                    logger.info(f"Resuming download of {href} from byte {offset:,} (attempt {attempt + 1}/{self.max_retries})")
+                else:
+                    logger.info(f"Downloading file from {href} (attempt {attempt + 1}/{self.max_retries})")
                 
-                response = requests.get(href, stream=True, timeout=self.timeout)
+                response = self.session.get(href, stream=True, timeout=self.timeout, headers=headers)
+                
+                # 416 means the partial file already reaches the end of the
+                # remote file: finalize it if the sizes match, else start over
+                if offset and response.status_code == 416:
+                    remote_size = response.headers.get('content-range', '').rpartition('/')[2]
+                    if remote_size == str(offset):
+                        os.replace(part_file, filename)
+                        logger.info(f"Partial file already complete. Saved {offset:,} bytes to {filename}")
+                        return
+                    logger.warning("Partial file does not match the remote file. Restarting download from scratch.")
+                    offset = 0
+                    response = self.session.get(href, stream=True, timeout=self.timeout)
+                    
                 response.raise_for_status()
                 
+                if offset and response.status_code != 206:
+                    logger.warning("Server ignored the range request. Restarting download from scratch.")
+                    offset = 0
+                
                 # Get total file size if available
-                total_size = int(response.headers.get('content-length', 0))
+                total_size = offset + int(response.headers.get('content-length', 0))
                 
-                downloaded = 0
-                chunk_size = 8192
+                downloaded = offset
+                # Log progress for large files (> 1MB); decided once so the
+                # chunk loop does no formatting when DEBUG is disabled
+                log_progress = total_size > 1_000_000 and logger.isEnabledFor(logging.DEBUG)
                 
-                with open(filename, 'wb') as file:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
+                with open(part_file, 'ab' if offset else 'wb', buffering=self.chunk_size) as file:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
                         if chunk:
                             file.write(chunk)
                             downloaded += len(chunk)
                             
-                            # Log progress for large files (> 1MB)
-                            if total_size > 1_000_000 and downloaded % (1024 * 1024) == 0:
+                            if log_progress and downloaded % (1024 * 1024) == 0:
                                 pct = (downloaded / total_size * 100) if total_size else 0
                                 logger.debug(f"Downloaded {downloaded:,} / {total_size:,} bytes ({pct:.1f}%)")
                 
+                os.replace(part_file, filename)
                 logger.info(f"Successfully downloaded {downloaded:,} bytes to {filename}")
                 return
                 
@@ -162,6 +255,97 @@ class RentContractsDownloader:
                 logger.error(f"Error writing to file {filename}: {e}")
                 raise
 
+    def _probe_range_support(self, href: str) -> int:
+        """
+        Check whether the server supports byte-range requests for href.
+        
+        Args:
+            href: URL to probe
+            
+        Returns:
+            Size of the remote file in bytes, or 0 if ranges are not supported
+        """
+        try:
+            response = self.session.head(href, timeout=self.timeout, allow_redirects=True, headers=RANGE_HEADERS)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"HEAD request failed for {href}: {e}")
+            return 0
+            
+        if response.headers.get('accept-ranges', '').lower() != 'bytes':
+            return 0
+            
+        return int(response.headers.get('content-length', 0))
+
+    def download_file_parallel(self, href: str, filename: str, total_size: int) -> None:
+        """
+        Download the file in byte ranges over several connections and join them.
+        
+        Args:
+            href: URL to download from (must support range requests)
+            filename: Local filename to save to
+            total_size: Size of the remote file in bytes
+            
+        Raises:
+            requests.exceptions.RequestException: If any range fails to download
+        """
+        connections = min(self.connections, max(1, total_size // self.min_part_size))
+        part_size = -(-total_size // connections)  # ceiling division
+        starts = list(range(0, total_size, part_size))
+        ends = [min(start + part_size, total_size) - 1 for start in starts]
+        part_files = [f"{filename}.part{i}" for i in range(len(starts))]
+        joined_file = f"{filename}.part"
+        
+        logger.info(f"Downloading {total_size:,} bytes from {href} over {len(starts)} connections")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(starts)) as executor:
+                list(executor.map(self._download_range, [href] * len(starts), part_files, starts, ends))
+                
+            # Join into the single-stream partial file and rename it once
+            # complete, so an interrupted join never leaves a truncated file
+            # at the final path; what was joined is a valid prefix to resume
+            with open(joined_file, 'wb') as file:
+                for part_file in part_files:
+                    with open(part_file, 'rb') as part:
+                        shutil.copyfileobj(part, file, length=self.chunk_size)
+            os.replace(joined_file, filename)
+        finally:
+            for part_file in part_files:
+                if os.path.isfile(part_file):
+                    os.remove(part_file)
+                    
+        logger.info(f"Successfully downloaded {total_size:,} bytes to {filename}")
+
+    def _download_range(self, href: str, part_file: str, start: int, end: int) -> None:
+        """
+        Download bytes start..end (inclusive) of href into part_file.
+        
+        Raises:
+            requests.exceptions.RequestException: If the range cannot be fetched
+        """
+        response = self.session.get(
+            href, stream=True, timeout=self.timeout, headers={**RANGE_HEADERS, "Range": f"bytes={start}-{end}"}
+        )
+        response.raise_for_status()
+        
+        if response.status_code != 206:
+            raise requests.exceptions.RequestException(
+                f"Server did not honour range request (status {response.status_code})"
+            )
+            
+        written = 0
+        with open(part_file, 'wb', buffering=self.chunk_size) as file:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    file.write(chunk)
+                    written += len(chunk)
+                    
+        if written != end - start + 1:
+            raise requests.exceptions.RequestException(
+                f"Incomplete range {start}-{end}: received {written:,} bytes"
+            )
+
     def run(self, filename: str) -> bool:
         """
         Run the downloader to fetch, parse, and download the rent contract file.
@@ -173,8 +357,7 @@ class RentContractsDownloader:
             True if successful, False otherwise
         """
         try:
-            html_content = self.fetch_rent_contracts()
-            href = self.parse_html(html_content)
+            href = self.fetch_download_link()
             
             if href:
                 self.download_file(href, filename)
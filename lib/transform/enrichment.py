@@ -223,10 +223,12 @@ class RentContractsEnricher:
         if "property_usage_en" in df.columns:
             logger.debug("Adding usage category...")
             
+            # The transformer writes the usage type as Categorical
+            usage = pl.col("property_usage_en").cast(pl.String)
             df = df.with_columns(
-                pl.when(pl.col("property_usage_en").str.contains("(?i)residential"))
+                pl.when(usage.str.contains("(?i)residential"))
                 .then(pl.lit("Residential"))
-                .when(pl.col("property_usage_en").str.contains("(?i)commercial"))
+                .when(usage.str.contains("(?i)commercial"))
                 .then(pl.lit("Commercial"))
                 .otherwise(pl.lit("Other"))
                 .alias("usage_category")
@@ -4,14 +4,48 @@ Rent contracts transformer with data quality checks and validation.
 
 from datetime import date
 import logging
+import os
 import polars as pl
-from typing import Optional
+from typing import List, Optional, Union
 
-from lib.config import FILE_CONFIG
+from lib.config import DATA_QUALITY_RULES, FILE_CONFIG
 from lib.classes.validators import validate_rent_contracts
 
 logger = logging.getLogger(__name__)
 
+# Declared dtypes for the DLD CSV. The numeric columns are parsed by the CSV
+# reader directly instead of being inferred from a sample and cast later, and
+# the dd-mm-YYYY dates are pinned to strings so they always reach the
+# str.to_date parsing below. The low-cardinality usage type is dictionary-encoded
+# while reading so reports group on integer codes. Columns missing from a file
+# are ignored.
+CSV_SCHEMA_OVERRIDES = {
+    "property_usage_en": pl.Categorical,
+    "contract_start_date": pl.String,
+    "contract_end_date": pl.String,
+    "ejari_property_sub_type_id": pl.Int64,
+    "actual_area": pl.Float64,
+    "annual_amount": pl.Float64,
+    "contract_amount": pl.Float64,
+    "no_of_prop": pl.Int64,
+}
+
+# Columns read by the validator and the transformation statistics; the
+# validation sample is projected to these instead of materializing every column.
+VALIDATION_COLUMNS = {
+    *DATA_QUALITY_RULES["required_fields"],
+    *DATA_QUALITY_RULES["numeric_fields"],
+    *DATA_QUALITY_RULES["date_fields"],
+    "actual_area",
+}
+
+PARQUET_WRITE_OPTIONS = {
+    "compression": FILE_CONFIG["parquet_compression"],
+    "compression_level": FILE_CONFIG["parquet_compression_level"],
+    "row_group_size": FILE_CONFIG["parquet_row_group_size"],
+    "statistics": FILE_CONFIG["parquet_statistics"],
+}
+
 
 class RentContractsTransformer:
     """
@@ -24,7 +58,13 @@ class RentContractsTransformer:
     - Comprehensive error handling
     """
     
-    def __init__(self, input_file: str, output_file: str, validate: bool = True):
+    def __init__(
+        self,
+        input_file: str,
+        output_file: str,
+        validate: bool = True,
+        sort_by: Optional[List[str]] = None,
+    ):
         """
         Initialize transformer.
         
@@ -32,10 +72,16 @@ class RentContractsTransformer:
             input_file: Path to input CSV file
             output_file: Path to output Parquet file
             validate: Whether to run data validation
+            sort_by: Columns to sort the output by. Clustering on commonly
+                filtered columns keeps each row group's min/max statistics
+                narrow, so filtered scans can skip most row groups. The sort
+                is blocking: the whole dataset is held in memory before the
+                write instead of streaming through.
         """
         self.input_file = input_file
         self.output_file = output_file
         self.validate = validate
+        self.sort_by = sort_by
 
     def transform(self) -> bool:
         """
@@ -54,11 +100,9 @@ class RentContractsTransformer:
                 null_values=["null", "NULL", ""],
                 encoding="utf8-lossy",
                 ignore_errors=True,
-                schema_overrides={
-                    "ejari_property_sub_type_id": pl.Int64,
-                    "actual_area": pl.Float64,
-                    "annual_amount": pl.Float64,
-                }
+                schema_overrides=CSV_SCHEMA_OVERRIDES,
+                # Parse in smaller batches to bound peak memory while streaming
+                low_memory=True,
             )
             
             # Explicitly parse date columns
@@ -71,8 +115,11 @@ class RentContractsTransformer:
             # Run validation and log stats on a sample if enabled
             if self.validate:
                 sample_size = 100_000
+                all_columns = lf.collect_schema().names()
+                sample_columns = [col for col in all_columns if col in VALIDATION_COLUMNS]
+                
                 logger.info(f"Collecting sample of {sample_size:,} rows for validation and stats...")
-                df_sample = lf.head(sample_size).collect()
+                df_sample = lf.select(sample_columns).head(sample_size).collect()
                 
                 logger.info(f"Runing data validation on sample ({df_sample.height:,} records)...")
                 validation_result = validate_rent_contracts(df_sample, strict=False)
@@ -82,21 +129,28 @@ class RentContractsTransformer:
                 if validation_result.errors:
                     logger.warning("Validation errors found in sample:")
                     for error in validation_result.errors[:10]:
-                        logger.warning(f"  - {error}")
+                        logger.warning("  - %s", error)
                 
                 # Log transformation statistics based on sample
-                self._log_statistics(df_sample)
+                self._log_statistics(df_sample, total_columns=len(all_columns))
             
-            # Write to Parquet with compression using sink_parquet for memory efficiency
-            logger.info("Writing to Parquet format (streaming)...")
-            compression = FILE_CONFIG["parquet_compression"]
-            compression_level = FILE_CONFIG["parquet_compression_level"]
+            if self.sort_by:
+                logger.info(f"Sorting output by {', '.join(self.sort_by)}...")
+                lf = lf.sort(self.sort_by, nulls_last=True)
             
-            lf.sink_parquet(
-                self.output_file,
-                compression=compression,
-                compression_level=compression_level
-            )
+            # Write to Parquet with compression using sink_parquet for memory efficiency.
+            # Stream into a partial file and rename it into place once complete, so
+            # an interrupted write never leaves a truncated file at the output path
+            # for the skip-if-exists checks to mistake for a finished one.
+            logger.info("Writing to Parquet format (streaming)...")
+            part_file = f"{self.output_file}.part"
+            try:
+                lf.sink_parquet(part_file, **PARQUET_WRITE_OPTIONS)
+            except BaseException:
+                if os.path.exists(part_file):
+                    os.remove(part_file)
+                raise
+            os.replace(part_file, self.output_file)
             
             logger.info(f"Successfully transformed data to {self.output_file}")
             return True
@@ -113,35 +167,42 @@ class RentContractsTransformer:
             logger.exception(f"Unexpected error during transformation: {e}")
             return False
     
-    def _log_statistics(self, df: pl.DataFrame) -> None:
+    def _log_statistics(self, df: pl.DataFrame, total_columns: Optional[int] = None) -> None:
         """
         Log transformation statistics.
         
         Args:
             df: DataFrame to analyze
+            total_columns: Column count of the full dataset, if df is a projection
         """
+        # The statistics only feed log lines; skip computing them entirely
+        # when INFO records would be dropped
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         try:
             # Basic statistics
             logger.info("=== Transformation Statistics ===")
             logger.info(f"Total records: {df.height:,}")
-            logger.info(f"Total columns: {len(df.columns)}")
+            logger.info(f"Total columns: {total_columns if total_columns is not None else len(df.columns)}")
             
-            # Null counts for key fields
+            # Null count and rent stats for key fields in a single pass; the
+            # aggregations already skip nulls, so no filtered copy is needed
             if "annual_amount" in df.columns:
-                null_rent = df["annual_amount"].null_count()
+                rent = pl.col("annual_amount")
+                null_rent, min_rent, max_rent, avg_rent, median_rent = df.select([
+                    rent.null_count().alias("null_rent"),
+                    rent.min().alias("min_rent"),
+                    rent.max().alias("max_rent"),
+                    rent.mean().alias("avg_rent"),
+                    rent.median().alias("median_rent"),
+                ]).row(0)
                 logger.info(f"Records with null rent: {null_rent:,}")
                 
                 if null_rent < df.height:
-                    stats = df.filter(pl.col("annual_amount").is_not_null()).select([
-                        pl.col("annual_amount").min().alias("min_rent"),
-                        pl.col("annual_amount").max().alias("max_rent"),
-                        pl.col("annual_amount").mean().alias("avg_rent"),
-                        pl.col("annual_amount").median().alias("median_rent"),
-                    ]).row(0)
-                    
-                    logger.info(f"Rent range: AED {stats[0]:,.0f} - {stats[1]:,.0f}")
-                    logger.info(f"Average rent: AED {stats[2]:,.0f}")
-                    logger.info(f"Median rent: AED {stats[3]:,.0f}")
+                    logger.info(f"Rent range: AED {min_rent:,.0f} - {max_rent:,.0f}")
+                    logger.info(f"Average rent: AED {avg_rent:,.0f}")
+                    logger.info(f"Median rent: AED {median_rent:,.0f}")
             
             # Property usage distribution
             if "property_usage_en" in df.columns:
@@ -164,22 +225,32 @@ class StarSchema:
     """
     Use SQL query to find the businesses that are nearby the metro stations
     """
-    def __init__(self, rent_contracts_df: pl.DataFrame, query: str):
+    def __init__(self, rent_contracts_df: Union[pl.DataFrame, pl.LazyFrame], query: str):
         self.rent_contracts_df = rent_contracts_df
         self.query = query
+        # The query is fixed, so parse and plan it once instead of on every call
+        self._plan = pl.SQLContext(rent_contracts_df=rent_contracts_df).execute(query)
 
     def transform(self) -> pl.DataFrame:
         """
         Use SQL query to find the businesses that are nearby the metro stations
 
         Args:
-            rent_contracts_df: Input DataFrame
+            rent_contracts_df: Input DataFrame or LazyFrame. A LazyFrame (e.g. from
+                ``pl.scan_parquet``) lets the query push projections and filters
+                down to the scan, so only its result is materialized.
             query: SQL query to find the businesses that are nearby the metro stations. Import queries from analysis folder
 
         Returns:
             pl.DataFrame: DataFrame containing the businesses that are nearby the metro stations
         """
-        
-        ctx = pl.SQLContext(rent_contracts_df=self.rent_contracts_df)
-        results = ctx.execute(self.query).collect()
-        return results
\ No newline at end of file
+        return self.transform_lazy().collect()
+
+    def transform_lazy(self) -> pl.LazyFrame:
+        """
+        Build the query plan without executing it.
+
+        Returns:
+            pl.LazyFrame: Query plan that can be collected or streamed to disk
+        """
+        return self._plan
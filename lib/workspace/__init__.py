@@ -1,5 +1,24 @@
 
-from .github_client import GitHubRelease
-from .zenodo_client import Zenodo, ZenodoUploader, ZenodoDeleter
+import importlib
 
-__all__ = ["GitHubRelease", "Zenodo", "ZenodoUploader", "ZenodoDeleter"]
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562), so importing one
+# client does not pay for - or trigger the import-time side effects of - the others.
+_EXPORTS = {
+    "GitHubRelease": ".github_client",
+    "Zenodo": ".zenodo_client",
+    "ZenodoUploader": ".zenodo_client",
+    "ZenodoDeleter": ".zenodo_client",
+}
+
+__all__ = ["GitHubRelease", "Zenodo", "ZenodoUploader", "ZenodoDeleter"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import date
+import hashlib
 import logging
 import os
 
@@ -8,6 +11,28 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 GITHUB_API_URL = "https://api.github.com"
+MAX_UPLOAD_WORKERS = 4
+
+class _HashingReader:
+    """
+    Wraps a binary file so the bytes read for an upload are also hashed.
+
+    requests sends objects with read() as a streamed body, sized by __len__,
+    so the asset is read from disk once.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self._size = os.fstat(f.fileno()).st_size
+        self.digest = hashlib.sha256()
+
+    def __len__(self):
+        return self._size
+
+    def read(self, size=-1):
+        chunk = self._f.read(size)
+        self.digest.update(chunk)
+        return chunk
 
 class GitHubRelease:
     """
@@ -17,6 +42,7 @@ class GitHubRelease:
         repo (str): The GitHub repository in the format 'owner/repo'.
         token (str): The GitHub token for authentication.
         headers (dict): The headers for GitHub API requests.
+        session (requests.Session): Pooled session reused for every API call and upload.
 
     Methods:
         create_release():
@@ -26,7 +52,7 @@ class GitHubRelease:
             Uploads files to the specified GitHub release.
         
         publish(files):
-            Creates a new release and uploads the specified files to it.
+            Uploads the specified files to today's release, creating it if needed.
 
     Usage:
         publisher = GitHubReleasePublisher(repo="owner/repo")
@@ -42,9 +68,17 @@ class GitHubRelease:
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        # One keep-alive pool per host, large enough for every upload worker,
+        # so release lookups and uploads reuse TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=MAX_UPLOAD_WORKERS))
+        # Releases found or created by this client, by tag name, so repeated
+        # lookups from publish() and release_exists() skip the round trip
+        self._release_cache = {}
 
     def create_release(self):
-        tag_name = f"release-{date.today()}"
+        tag_name = self._tag_name()
         release_name = f"Release {date.today()}"
 
         release_data = {
@@ -56,9 +90,10 @@ class GitHubRelease:
         }
 
         try:
-            response = requests.post(f"{GITHUB_API_URL}/repos/{self.repo}/releases", headers=self.headers, json=release_data)
+            response = self.session.post(f"{GITHUB_API_URL}/repos/{self.repo}/releases", json=release_data)
             response.raise_for_status()
             release = response.json()
+            self._release_cache[tag_name] = release
             logger.info(f"Created GitHub release {release_name}")
             return release
         except requests.exceptions.RequestException as e:
@@ -66,43 +101,161 @@ class GitHubRelease:
             raise
 
     def upload_files(self, release, files):
-        for file in files:
-            try:
-                with open(file, 'rb') as f:
-                    upload_url = release['upload_url'].split('{')[0] + f"?name={file}"
-                    upload_headers = self.headers.copy()
-                    upload_headers["Content-Type"] = "application/octet-stream"
-
-                    upload_response = requests.post(upload_url, headers=upload_headers, data=f)
-                    upload_response.raise_for_status()
-                    logger.info(f"Uploaded {file} to GitHub release {release['name']}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Failed to upload {file}: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error uploading {file}: {e}")
+        """
+        Uploads files to a release concurrently.
+
+        Each asset is an independent, network-bound upload, so up to
+        MAX_UPLOAD_WORKERS files are sent at once. A failed upload is logged
+        and does not stop the others.
+
+        Args:
+            release (dict): The release to upload to.
+            files (list): Paths of the files to upload.
+
+        Returns:
+            bool: True if every file was uploaded, False otherwise.
+        """
+        if not files:
+            return True
+        with ThreadPoolExecutor(max_workers=min(len(files), MAX_UPLOAD_WORKERS)) as executor:
+            return all(list(executor.map(lambda file: self._upload_file(release, file), files)))
+
+    @staticmethod
+    def _reported_digest(response):
+        """
+        Returns the asset digest from an upload response, if it has one.
+
+        Args:
+            response (requests.Response): Response to the asset upload.
+
+        Returns:
+            str: The "digest" field, or None if the body is not JSON or lacks it.
+        """
+        try:
+            asset = response.json()
+        except ValueError:
+            return None
+        return asset.get("digest") if isinstance(asset, dict) else None
+
+    def _delete_existing_asset(self, release, name):
+        """
+        Deletes the release asset with the given name, if the release has one.
+
+        GitHub rejects an upload whose name is already taken with a 422, so a
+        same-day re-run replaces its earlier assets instead.
+
+        Args:
+            release (dict): The release the asset belongs to.
+            name (str): The asset file name.
+        """
+        for asset in release.get('assets', []):
+            if asset.get('name') == name:
+                response = self.session.delete(f"{GITHUB_API_URL}/repos/{self.repo}/releases/assets/{asset['id']}")
+                response.raise_for_status()
+                logger.info(f"Deleted existing asset {name} from GitHub release {release['name']}")
+
+    def _upload_file(self, release, file):
+        name = os.path.basename(file)
+        try:
+            self._delete_existing_asset(release, name)
+            with open(file, 'rb') as f:
+                upload_url = release['upload_url'].split('{')[0] + f"?name={name}"
+                upload_headers = {"Content-Type": "application/octet-stream"}
+                body = _HashingReader(f)
+
+                upload_response = self.session.post(upload_url, headers=upload_headers, data=body)
+                upload_response.raise_for_status()
+                # GitHub reports the SHA-256 of the stored asset; compare it with
+                # the bytes actually sent
+                expected = f"sha256:{body.digest.hexdigest()}"
+                reported = self._reported_digest(upload_response)
+                if reported is None:
+                    logger.info(f"Uploaded {file} to GitHub release {release['name']} (digest unverified)")
+                    return True
+                if reported != expected:
+                    logger.error(f"Digest mismatch for {file}: sent {expected}, GitHub stored {reported}")
+                    return False
+                logger.info(f"Uploaded {file} to GitHub release {release['name']}")
+                return True
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to upload {file}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error uploading {file}: {e}")
+        return False
 
     def publish(self, files):
+        """
+        Uploads files to today's release, creating the release if needed.
+
+        Args:
+            files (list): Paths of the files to upload.
+
+        Returns:
+            bool: True if every file was uploaded, False otherwise.
+        """
+        tag_name = self._tag_name()
         try:
-            release = self.create_release()
-            self.upload_files(release, files)
+            # Re-runs on the same day upload into the existing release instead
+            # of failing to create a duplicate tag
+            release = self.get_release(tag_name) or self.create_release()
+            return self.upload_files(release, files)
         except Exception as e:
             logger.error(f"Failed to publish release: {e}")
+            return False
+        finally:
+            # The cached release's asset list is now stale
+            self._release_cache.pop(tag_name, None)
+
+    @staticmethod
+    def _tag_name():
+        return f"release-{date.today()}"
+
+    def get_release(self, tag_name):
+        """
+        Fetches the release with the specified tag name.
+
+        Found releases are cached per tag for the lifetime of this client, and
+        releases created through create_release() are recorded too. Misses are
+        not cached, so a release created since the last lookup is found.
+
+        Args:
+            tag_name (str): The tag name of the release to fetch.
+
+        Returns:
+            dict: The release, or None if no release has this tag.
+
+        Raises:
+            requests.exceptions.RequestException: If the lookup fails.
+        """
+        if tag_name in self._release_cache:
+            return self._release_cache[tag_name]
+
+        response = self.session.get(f"{GITHUB_API_URL}/repos/{self.repo}/releases/tags/{tag_name}")
+        if response.status_code == 404:
+            logger.info(f"No release found with tag {tag_name}.")
+            return None
+        response.raise_for_status()
+        logger.info(f"Found existing release with tag {tag_name}.")
+        release = response.json()
+        self._release_cache[tag_name] = release
+        return release
     
 
     def release_exists(self, tag_name):
         """
         Checks if a release with the specified tag name already exists.
 
+        Shares the get_release() cache, so a check followed by publish() costs
+        a single request. A failed lookup is logged and reported as False.
+
         Args:
             tag_name (str): The tag name of the release to check.
 
         Returns:
             bool: True if the release exists, False otherwise.
         """
-        response = requests.get(f"{GITHUB_API_URL}/repos/{self.repo}/releases/tags/{tag_name}", headers=self.headers)
-        if response.status_code == 200:
-            logger.info(f"Release with tag {tag_name} already exists.")
-            return True
-        if response.status_code == 404:
-            logger.info(f"No release found with tag {tag_name}.")
-            return False
\ No newline at end of file
+        try:
+            return self.get_release(tag_name) is not None
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to check release {tag_name}: {e}")
+            return False
@@ -17,21 +17,46 @@ Usage:
 from pathlib import Path
 import os
 from datetime import date
+from functools import wraps
+import inspect
 from dotenv import load_dotenv
 import logging
 
-from lib.extract.rent_contracts_downloader import RentContractsDownloader
-from lib.transform.rent_contracts_transformer import RentContractsTransformer
-from lib.classes.property_usage import PropertyUsage
-from lib.workspace import GitHubRelease
 from lib.logging_helpers import get_logger, configure_root_logger
+from lib.config import FILE_CONFIG
 
-load_dotenv()
-
-configure_root_logger(logfile="etl.log", loglevel="DEBUG")
 logger = get_logger("ETL")
 
 
+def skip_if_output_exists(arg: str):
+    """Skip the decorated pipeline step when its output file already exists.
+
+    The check is a single stat() made before the step touches Polars or
+    requests, so warm re-runs return almost immediately. It is only sound for
+    steps that write through a partial file and rename it into place, so the
+    output path never holds a truncated file.
+
+    Args:
+        arg: Name of the parameter holding the step's output path
+
+    Returns:
+        Decorator returning True without running the step if the output exists
+    """
+    def decorator(fn):
+        position = list(inspect.signature(fn).parameters).index(arg)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            path = kwargs[arg] if arg in kwargs else args[position]
+            if os.path.isfile(path):
+                logger.info(f"Output already exists: {path}. Skipping {fn.__name__}.")
+                return True
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@skip_if_output_exists("filename")
 def download_rent_contracts(url: str, filename: str) -> bool:
     """Download rent contracts data from source.
     
@@ -43,10 +68,7 @@ def download_rent_contracts(url: str, filename: str) -> bool:
         True if download successful or file already exists
     """
     logger.info("=== PHASE 1: DOWNLOAD ===")
-    
-    if os.path.isfile(filename):
-        logger.info(f"File already exists: {filename}. Skipping download.")
-        return True
+    from lib.extract.rent_contracts_downloader import RentContractsDownloader
 
     logger.info(f"Downloading from {url} to {filename}")
     try:
@@ -62,22 +84,30 @@ def download_rent_contracts(url: str, filename: str) -> bool:
         raise
 
 
-def transform_data(input_csv: str, output_parquet: str) -> bool:
+@skip_if_output_exists("output_parquet")
+def transform_data(input_csv: str, output_parquet: str, remove_input: bool = False) -> bool:
     """Transform raw CSV to Parquet with validation.
     
     Args:
         input_csv: Path to source CSV file
         output_parquet: Path to destination Parquet file
+        remove_input: Delete the source CSV once the Parquet file is written
         
     Returns:
-        True if transformation successful
+        True if transformation successful or output already exists
     """
     logger.info("=== PHASE 2: TRANSFORM ===")
+    from lib.transform.rent_contracts_transformer import RentContractsTransformer
     
     try:
-        transformer = RentContractsTransformer(input_csv, output_parquet, validate=True)
+        transformer = RentContractsTransformer(
+            input_csv, output_parquet, validate=True, sort_by=FILE_CONFIG["parquet_sort_by"]
+        )
         if transformer.transform():
             logger.info(f"Transformation complete: {output_parquet}")
+            if remove_input:
+                Path(input_csv).unlink(missing_ok=True)
+                logger.info(f"Removed intermediate CSV: {input_csv}")
             return True
         else:
             logger.error("Transformation failed.")
@@ -98,6 +128,7 @@ def analyze_property_usage(input_parquet: str, output_report: str) -> bool:
         True if analysis successful
     """
     logger.info("=== PHASE 3: ANALYZE ===")
+    from lib.classes.property_usage import PropertyUsage
     
     try:
         analyzer = PropertyUsage(output_report)
@@ -123,20 +154,29 @@ def publish_artifacts_to_github(files: list, release_notes: str = "RELEASE_NOTES
         return
     
     try:
-        # Filter to only existing files
-        existing_files = [f for f in files if os.path.exists(f)]
+        # Filter to only existing files; one stat() per file gives both
+        # existence and size
+        file_sizes = {}
+        for f in files:
+            try:
+                file_sizes[f] = os.stat(f).st_size
+            except FileNotFoundError:
+                logger.warning(f"Artifact not found, skipping: {f}")
+        existing_files = list(file_sizes)
         
         if not existing_files:
             logger.error("No files to publish!")
             return
         
         logger.info(f"Publishing {len(existing_files)} files to GitHub:")
-        for f in existing_files:
-            size_mb = os.path.getsize(f) / (1024 * 1024)
-            logger.info(f"  - {f} ({size_mb:.1f} MB)")
+        for f, size in file_sizes.items():
+            logger.info("  - %s (%.1f MB)", f, size / (1024 * 1024))
         
+        from lib.workspace.github_client import GitHubRelease
         publisher = GitHubRelease('dataengineergaurav/rental-market-dynamics-dubai')
-        publisher.publish(files=existing_files)
+        if not publisher.publish(files=existing_files):
+            logger.error("GitHub publication failed: not every artifact was uploaded.")
+            return
         
         logger.info("✓ GitHub publication complete!")
         
@@ -154,29 +194,39 @@ def main():
 
     # Configuration
     url = os.getenv("DLD_URL")
+    gh_token = os.getenv("GH_TOKEN")
     if not url:
         logger.error("DLD_URL environment variable not set. Please set it in .env file.")
         return
 
-    # File paths
-    date_str = date.today().strftime('%Y%m%d')
+    # File paths (resolve the date once so a run crossing midnight keeps
+    # consistent filenames)
+    today = date.today()
+    date_str = today.strftime('%Y%m%d')
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
     
-    csv_filename = output_dir / f'rent_contracts_{date.today()}.csv'
-    parquet_filename = f'rent_contracts_{date_str}.parquet'
-    property_usage_report = f'property_usage_{date_str}.csv'
+    csv_filename = output_dir / f'rent_contracts_{today.isoformat()}.csv'
+    parquet_filename = str(output_dir / f'rent_contracts_{date_str}.parquet')
+    property_usage_report = str(output_dir / f'property_usage_{date_str}.csv')
     
     try:
-        # Step 1: Download
-        if not download_rent_contracts(url, str(csv_filename)):
-            logger.error("Pipeline stopped at Download phase.")
-            return
+        # The CSV is only an intermediate: once today's Parquet exists there
+        # is nothing to download or transform. The transformer renames the
+        # Parquet into place only after a complete write, so a run killed
+        # mid-transform leaves no file here and the next run redoes the step.
+        if os.path.isfile(parquet_filename):
+            logger.info(f"Parquet already exists: {parquet_filename}. Skipping Download and Transform.")
+        else:
+            # Step 1: Download
+            if not download_rent_contracts(url, str(csv_filename)):
+                logger.error("Pipeline stopped at Download phase.")
+                return
 
-        # Step 2: Transform
-        if not transform_data(str(csv_filename), parquet_filename):
-            logger.error("Pipeline stopped at Transform phase.")
-            return
+            # Step 2: Transform
+            if not transform_data(str(csv_filename), parquet_filename, remove_input=True):
+                logger.error("Pipeline stopped at Transform phase.")
+                return
 
         # Step 3: Analyze
         if not analyze_property_usage(parquet_filename, property_usage_report):
@@ -185,7 +235,7 @@ def main():
 
         # Step 4: Publish (Optional)
         # Check if GH_TOKEN is set to determine if we should publish
-        if os.getenv("GH_TOKEN"):
+        if gh_token:
             artifacts = [
                 parquet_filename,
                 property_usage_report
@@ -207,4 +257,16 @@ def main():
 
 
 if __name__ == "__main__":
+    # Only read .env and open etl.log when run as a script, so importing
+    # this module (tests, tooling) has no side effects.
+    load_dotenv()
+    configure_root_logger(logfile="etl.log", loglevel=os.getenv("ETL_LOGLEVEL", "INFO"))
+
+    # Polars is imported only after .env is loaded, so POLARS_MAX_THREADS
+    # set there sizes the thread pool. Run collect() on the streaming engine
+    # so full-table queries stay within bounded memory.
+    import polars as pl
+
+    pl.Config.set_engine_affinity(os.getenv("ETL_POLARS_ENGINE", "streaming"))
+    logger.info(f"Polars engine: {os.getenv('ETL_POLARS_ENGINE', 'streaming')}, threads: {pl.thread_pool_size()}")
     main()
@@ -1,23 +1,102 @@
 from datetime import date
+import gzip
+import hashlib
 import os
+import logging
 import pytest
+import shutil
 import sys
 import requests
 import polars as pl
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import tempfile
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from lib.workspace.github_client import GitHubRelease
+from lib.workspace.github_client import GITHUB_API_URL, MAX_UPLOAD_WORKERS, GitHubRelease
 from lib.extract.rent_contracts_downloader import RentContractsDownloader
-from lib.transform.rent_contracts_transformer import RentContractsTransformer, StarSchema
+from lib.transform.rent_contracts_transformer import (
+    CSV_SCHEMA_OVERRIDES,
+    RentContractsTransformer,
+    StarSchema,
+)
 from lib.classes.property_usage import PropertyUsage
 from lib.classes.validators import RentContractValidator, validate_rent_contracts
 
 import pytest
 import requests_mock
 
+
+@contextmanager
+def serve_http(handler_class):
+    """Serve handler_class on a local port for the duration of the block."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def dld_handler(csv_bytes, requests_seen):
+    """Handler serving a DLD landing page that links to csv_bytes, sent gzipped."""
+    class DLDHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        
+        def do_GET(self):
+            requests_seen.append((self.path, self.headers.get("Accept-Encoding", "")))
+            if self.path == "/rent_contracts.csv":
+                body = gzip.compress(csv_bytes)
+                self.send_response(200)
+                self.send_header("Content-Encoding", "gzip")
+            else:
+                href = f"http://127.0.0.1:{self.server.server_port}/rent_contracts.csv"
+                body = f'<html><body><a class="action-icon-anchor" href="{href}">CSV</a></body></html>'.encode()
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    return DLDHandler
+
+
+@pytest.fixture
+def downloader():
+    """Fresh downloader, with its own session, for each downloader test."""
+    return RentContractsDownloader("https://example.com/test")
+
+
+@pytest.fixture
+def transformer():
+    """Fresh transformer for each transformer test."""
+    return RentContractsTransformer("test_input.csv", "test_output.parquet", validate=False)
+
+
+@pytest.fixture
+def property_usage():
+    """Fresh property usage report for each property usage test."""
+    return PropertyUsage("test_property_usage.csv")
+
+
+@pytest.fixture
+def validator():
+    """Fresh non-strict validator for each validator test."""
+    return RentContractValidator(strict_mode=False)
+
+
 class TestGitHubRelease:
     @classmethod
     def setup_class(cls):
@@ -45,25 +124,218 @@ class TestGitHubRelease:
         file_path.write_text("Test content")
         requests_mock.post(self.mock_release["upload_url"].split("{")[0] + "?name=test_file.txt", status_code=201)
         self.github_release.upload_files(self.mock_release, [str(file_path)])
+        assert requests_mock.last_request.qs == {"name": ["test_file.txt"]}
+        assert requests_mock.last_request.headers["Authorization"] == "token test_token"
+        assert requests_mock.last_request.headers["Content-Type"] == "application/octet-stream"
+    
+    def test_upload_files_digest(self, requests_mock, tmp_path, caplog):
+        """Test uploads hash the streamed body and check it against GitHub's digest."""
+        content = os.urandom(3 * 1024 * 1024 + 17)
+        file_path = tmp_path / "rent_contracts.parquet"
+        file_path.write_bytes(content)
+        bodies = []
+        stored = {"digest": f"sha256:{hashlib.sha256(content).hexdigest()}"}
+        
+        def read_body(request, context):
+            bodies.append(request.body.read())
+            context.status_code = 201
+            return stored
+        
+        upload_url = self.mock_release["upload_url"].split("{")[0] + "?name=rent_contracts.parquet"
+        requests_mock.post(upload_url, json=read_body)
+        
+        with caplog.at_level(logging.INFO, logger="lib.workspace.github_client"):
+            self.github_release.upload_files(self.mock_release, [str(file_path)])
+        
+        # The file is read once, as the request body, and sent whole
+        assert bodies == [content]
+        assert requests_mock.last_request.headers["Content-Length"] == str(len(content))
+        assert "Digest mismatch" not in caplog.text
+        assert f"Uploaded {file_path}" in caplog.text
+        
+        caplog.clear()
+        stored["digest"] = "sha256:" + "0" * 64
+        with caplog.at_level(logging.INFO, logger="lib.workspace.github_client"):
+            self.github_release.upload_files(self.mock_release, [str(file_path)])
+        
+        assert f"Digest mismatch for {file_path}" in caplog.text
+        assert f"Uploaded {file_path}" not in caplog.text
+    
+    @pytest.mark.parametrize("response", [{"text": "created"}, {"json": {"id": 1}}, {"json": []}])
+    def test_upload_files_digest_unverified(self, requests_mock, tmp_path, caplog, response):
+        """Test an upload whose response carries no digest is logged as unverified, not failed."""
+        file_path = tmp_path / "rent_contracts.parquet"
+        file_path.write_bytes(b"contents")
+        upload_url = self.mock_release["upload_url"].split("{")[0] + "?name=rent_contracts.parquet"
+        requests_mock.post(upload_url, status_code=201, **response)
+        
+        with caplog.at_level(logging.INFO, logger="lib.workspace.github_client"):
+            self.github_release.upload_files(self.mock_release, [str(file_path)])
+        
+        assert f"Uploaded {file_path} to GitHub release Test Release (digest unverified)" in caplog.text
+        assert "error" not in caplog.text.lower()
+    
+    def test_upload_files_multiple(self, requests_mock, tmp_path):
+        """Test every file is uploaded and one failure does not stop the others."""
+        upload_url = self.mock_release["upload_url"].split("{")[0]
+        names = ["a.parquet", "b.csv", "c.csv"]
+        for name in names:
+            (tmp_path / name).write_text(name)
+        uploads = {name: requests_mock.post(f"{upload_url}?name={name}", status_code=201) for name in names}
+        requests_mock.post(f"{upload_url}?name=b.csv", status_code=500)
+        
+        result = self.github_release.upload_files(self.mock_release, [str(tmp_path / name) for name in names])
+        
+        assert result is False
+        assert uploads["a.parquet"].call_count == 1
+        assert uploads["c.csv"].call_count == 1
+    
+    def test_upload_files_parallel(self, tmp_path):
+        """Test the release assets are uploaded concurrently, not one after another."""
+        names = ["rent_contracts.parquet", "property_usage.csv"]
+        # Each upload blocks until the other one is in flight too
+        barrier = threading.Barrier(len(names), timeout=5)
+        uploaded = []
+        
+        class UploadHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                barrier.wait()
+                uploaded.append(self.path)
+                self.send_response(201)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            
+            def log_message(self, *args):
+                pass
+        
+        for name in names:
+            (tmp_path / name).write_text(name)
+        
+        # requests_mock serializes requests behind a lock, so serve the uploads for real
+        with serve_http(UploadHandler) as url:
+            release = {"upload_url": url + "assets{?name,label}", "name": "Test Release"}
+            self.github_release.upload_files(release, [str(tmp_path / name) for name in names])
+        
+        assert not barrier.broken
+        assert sorted(uploaded) == sorted(f"/assets?name={name}" for name in names)
     
     def test_release_exists(self, requests_mock):
         """Test checking if a release exists."""
         tag_name = "release-2025-02-28"
-        requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", status_code=200)
+        requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", json=self.mock_release, status_code=200)
         assert self.github_release.release_exists(tag_name) is True
 
-        requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", status_code=404)
+        missing_tag = "release-2025-03-01"
+        requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{missing_tag}", status_code=404)
+        assert self.github_release.release_exists(missing_tag) is False
+    
+    def test_release_exists_error(self, requests_mock):
+        """Test an unexpected status is reported as a missing release, not raised."""
+        tag_name = "release-2025-02-28"
+        requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", status_code=500)
+        
         assert self.github_release.release_exists(tag_name) is False
+        with pytest.raises(requests.exceptions.HTTPError):
+            self.github_release.get_release(tag_name)
+    
+    def test_release_exists_cached(self, requests_mock):
+        """Test found releases are cached and misses are looked up again."""
+        tag_name = "release-2025-02-28"
+        lookup = requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", status_code=404)
+        
+        assert self.github_release.release_exists(tag_name) is False
+        assert self.github_release.release_exists(tag_name) is False
+        assert lookup.call_count == 2
+        
+        # A release created through the client is known to exist
+        requests_mock.post(f"https://api.github.com/repos/{self.repo}/releases", json=self.mock_release, status_code=201)
+        with patch.object(GitHubRelease, '_tag_name', return_value=tag_name):
+            self.github_release.create_release()
+        assert self.github_release.release_exists(tag_name) is True
+        assert self.github_release.get_release(tag_name) == self.mock_release
+        assert lookup.call_count == 2
+        
+        # A release created elsewhere since the last miss is found and cached
+        other_tag = "release-2025-03-01"
+        other = requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{other_tag}",
+                                  [{"status_code": 404}, {"json": self.mock_release, "status_code": 200}])
+        assert self.github_release.release_exists(other_tag) is False
+        assert self.github_release.release_exists(other_tag) is True
+        assert self.github_release.release_exists(other_tag) is True
+        assert other.call_count == 2
+    
+    def test_publish_after_release_exists(self, requests_mock, tmp_path):
+        """Test publish reuses the release looked up by release_exists."""
+        file_path = tmp_path / "test_file.txt"
+        file_path.write_text("Test content")
+        
+        tag_name = f"release-{date.today()}"
+        lookup = requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", json=self.mock_release, status_code=200)
+        upload = requests_mock.post(self.mock_release["upload_url"].split("{")[0] + "?name=test_file.txt", status_code=201)
+        
+        assert self.github_release.release_exists(tag_name) is True
+        self.github_release.publish([str(file_path)])
+        
+        assert lookup.call_count == 1
+        assert upload.call_count == 1
     
     def test_publish(self, requests_mock, tmp_path):
         """Test publishing files to a new release."""
         file_path = tmp_path / "test_file.txt"
         file_path.write_text("Test content")
         
+        tag_name = f"release-{date.today()}"
+        requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", status_code=404)
         requests_mock.post(f"https://api.github.com/repos/{self.repo}/releases", json=self.mock_release, status_code=201)
-        requests_mock.post(self.mock_release["upload_url"].split("{")[0] + "?name=test_file.txt", status_code=201)
+        upload = requests_mock.post(self.mock_release["upload_url"].split("{")[0] + "?name=test_file.txt", status_code=201)
         
+        assert self.github_release.publish([str(file_path)]) is True
+        
+        assert upload.call_count == 1
+    
+    def test_publish_upload_failure(self, requests_mock, tmp_path):
+        """Test publish reports a failed upload instead of succeeding."""
+        file_path = tmp_path / "test_file.txt"
+        file_path.write_text("Test content")
+        
+        tag_name = f"release-{date.today()}"
+        requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", json=self.mock_release, status_code=200)
+        requests_mock.post(self.mock_release["upload_url"].split("{")[0] + "?name=test_file.txt", status_code=422)
+        
+        assert self.github_release.publish([str(file_path)]) is False
+    
+    def test_publish_existing_release(self, requests_mock, tmp_path):
+        """Test a same-day re-run replaces the assets it uploaded earlier."""
+        file_path = tmp_path / "test_file.txt"
+        file_path.write_text("Test content")
+        release = {**self.mock_release, "assets": [{"id": 7, "name": "test_file.txt"}, {"id": 8, "name": "other.csv"}]}
+        
+        tag_name = f"release-{date.today()}"
+        lookup = requests_mock.get(f"https://api.github.com/repos/{self.repo}/releases/tags/{tag_name}", json=release, status_code=200)
+        create = requests_mock.post(f"https://api.github.com/repos/{self.repo}/releases", json=self.mock_release, status_code=201)
+        delete = requests_mock.delete(f"https://api.github.com/repos/{self.repo}/releases/assets/7", status_code=204)
+        upload = requests_mock.post(self.mock_release["upload_url"].split("{")[0] + "?name=test_file.txt", status_code=201)
+        
+        assert self.github_release.publish([str(file_path)]) is True
+        
+        assert create.call_count == 0
+        assert delete.call_count == 1
+        assert upload.call_count == 1
+        # The old asset is gone before the new one is sent
+        methods = [request.method for request in requests_mock.request_history]
+        assert methods.index("DELETE") < methods.index("POST")
+        
+        # The asset list changed, so a second publish looks the release up again
         self.github_release.publish([str(file_path)])
+        assert lookup.call_count == 2
+    
+    def test_session_pool(self):
+        """Test API calls share a keep-alive pool sized for the upload workers."""
+        adapter = self.github_release.session.get_adapter(f"{GITHUB_API_URL}/repos/{self.repo}")
+        
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] >= MAX_UPLOAD_WORKERS
+        assert self.github_release.session.headers['Authorization'] == 'token test_token'
     
     def test_init_without_token(self):
         """Test initialization fails without GH_TOKEN."""
@@ -73,12 +345,13 @@ class TestGitHubRelease:
 
 
 class TestRentContractsDownloader:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, downloader):
         """Setup for each test method."""
-        self.test_url = "https://example.com/test"
-        self.downloader = RentContractsDownloader(self.test_url)
+        self.test_url = downloader.url
+        self.downloader = downloader
     
-    @patch('lib.extract.rent_contracts_downloader.requests.get')
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
     def test_fetch_rent_contracts_success(self, mock_get):
         """Test successful HTML fetch."""
         mock_response = Mock()
@@ -90,18 +363,43 @@ class TestRentContractsDownloader:
         assert result == b"<html><body>Test content</body></html>"
         mock_get.assert_called_once_with(self.test_url, timeout=30)
     
-    @patch('lib.extract.rent_contracts_downloader.requests.get')
-    def test_fetch_rent_contracts_retry(self, mock_get):
-        """Test retry logic on failure."""
-        mock_response = Mock()
-        mock_response.content = b"<html><body>Test content</body></html>"
-        mock_response.raise_for_status.return_value = None
-        mock_get.side_effect = [requests.exceptions.Timeout("Timeout"), mock_response]
+    @pytest.mark.parametrize("method", ["fetch_rent_contracts", "download_file"])
+    @patch.dict('lib.extract.rent_contracts_downloader.API_CONFIG', {'retry_backoff_factor': 0})
+    def test_retry(self, method, tmp_path):
+        """Test the session retries a 503 and reuses its connection."""
+        requests_seen = []
+        
+        class FlakyHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            
+            def do_GET(self):
+                requests_seen.append(self.client_address)
+                status, body = (503, b"busy") if len(requests_seen) == 1 else (200, b"<html>ok</html>")
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        file_path = tmp_path / "test_file.csv"
+        with serve_http(FlakyHandler) as url:
+            downloader = RentContractsDownloader(url)
+            if method == "fetch_rent_contracts":
+                result = downloader.fetch_rent_contracts()
+            else:
+                downloader.download_file(url, str(file_path))
+                result = file_path.read_bytes()
         
-        with patch('time.sleep'):
-            result = self.downloader.fetch_rent_contracts()
-            assert result == b"<html><body>Test content</body></html>"
-            assert mock_get.call_count == 2
+        assert result == b"<html>ok</html>"
+        assert len(requests_seen) == 2
+        assert requests_seen[0] == requests_seen[1]
     
     def test_parse_html_success(self):
         """Test successful HTML parsing."""
@@ -109,14 +407,48 @@ class TestRentContractsDownloader:
         result = self.downloader.parse_html(html_content)
         assert result == "download.csv"
     
+    def test_parse_html_chunked(self):
+        """Test the link is found when the page is fed in chunks split mid-tag."""
+        html_content = (
+            b'<html><body><a class="nav" href="home.html">Home</a>'
+            b'<a class="btn action-icon-anchor" href="download.csv">Download</a></body></html>'
+        )
+        split = html_content.index(b'action-icon')
+        result = self.downloader.parse_html(iter([html_content[:split], html_content[split:]]))
+        assert result == "download.csv"
+    
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_fetch_download_link_stops_reading(self, mock_get):
+        """Test the page is streamed and reading stops once the link is found."""
+        chunks_read = []
+        
+        def iter_content(chunk_size):
+            chunks = [b'<html><body><a class="action-icon-anchor" href="download.csv">CSV</a>']
+            chunks += [b'<p>filler</p>' * 1000] * 50
+            for chunk in chunks:
+                chunks_read.append(chunk)
+                yield chunk
+        
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.side_effect = iter_content
+        mock_get.return_value = mock_response
+        
+        assert self.downloader.fetch_download_link() == "download.csv"
+        mock_get.assert_called_once_with(self.test_url, timeout=30, stream=True)
+        assert len(chunks_read) == 1
+        # The response is closed instead of being read to the end
+        mock_response.__exit__.assert_called_once()
+    
     def test_parse_html_no_link(self):
         """Test HTML parsing when no download link found."""
         html_content = b'<html><body>No download link here</body></html>'
         result = self.downloader.parse_html(html_content)
         assert result is None
     
-    @patch('lib.extract.rent_contracts_downloader.requests.get')
-    def test_download_file_success(self, mock_get, tmp_path):
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.head')
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_download_file_success(self, mock_get, mock_head, tmp_path):
         """Test successful file download."""
         mock_response = Mock()
         mock_response.iter_content.return_value = [b"test", b"content"]
@@ -129,45 +461,146 @@ class TestRentContractsDownloader:
         
         assert file_path.exists()
         assert file_path.read_text() == "testcontent"
+        assert mock_get.call_args.kwargs['stream'] is True
+        mock_response.iter_content.assert_called_with(chunk_size=1024 * 1024)
     
-    @patch('lib.extract.rent_contracts_downloader.requests.get')
-    def test_download_file_retry(self, mock_get, tmp_path):
-        """Test retry logic on file download failure."""
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_download_file_resume(self, mock_get, tmp_path):
+        """Test an interrupted download resumes from the partial file."""
         mock_response = Mock()
+        mock_response.status_code = 206
+        mock_response.iter_content.return_value = [b"content"]
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = {'content-length': '7'}
+        mock_get.return_value = mock_response
+        
+        file_path = tmp_path / "test_file.csv"
+        (tmp_path / "test_file.csv.part").write_bytes(b"test")
+        self.downloader.download_file("http://example.com/file.csv", str(file_path))
+        
+        assert mock_get.call_args.kwargs['headers'] == {'Range': 'bytes=4-', 'Accept-Encoding': 'identity'}
+        assert file_path.read_text() == "testcontent"
+        assert not (tmp_path / "test_file.csv.part").exists()
+    
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_download_file_resume_already_complete(self, mock_get, tmp_path):
+        """Test a partial file the server reports as complete (416) is finalized."""
+        mock_get.return_value = Mock(status_code=416, headers={'content-range': 'bytes */11'})
+        
+        file_path = tmp_path / "test_file.csv"
+        (tmp_path / "test_file.csv.part").write_bytes(b"testcontent")
+        self.downloader.download_file("http://example.com/file.csv", str(file_path))
+        
+        assert mock_get.call_count == 1
+        assert file_path.read_text() == "testcontent"
+        assert not (tmp_path / "test_file.csv.part").exists()
+    
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_download_file_resume_unsatisfiable_range(self, mock_get, tmp_path):
+        """Test a partial file longer than the remote file is discarded and re-downloaded."""
+        full_response = Mock(status_code=200, headers={'content-length': '11'})
+        full_response.iter_content.return_value = [b"test", b"content"]
+        mock_get.side_effect = [Mock(status_code=416, headers={'content-range': 'bytes */11'}), full_response]
+        
+        file_path = tmp_path / "test_file.csv"
+        (tmp_path / "test_file.csv.part").write_bytes(b"stale partial file")
+        self.downloader.download_file("http://example.com/file.csv", str(file_path))
+        
+        assert 'Range' not in mock_get.call_args.kwargs.get('headers', {})
+        assert file_path.read_text() == "testcontent"
+    
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.head')
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_download_file_resume_not_supported(self, mock_get, mock_head, tmp_path):
+        """Test the download restarts when the server ignores the range request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
         mock_response.iter_content.return_value = [b"test", b"content"]
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {'content-length': '11'}
-        mock_get.side_effect = [requests.exceptions.Timeout("Timeout"), mock_response]
+        mock_get.return_value = mock_response
         
         file_path = tmp_path / "test_file.csv"
-        with patch('time.sleep'):
-            self.downloader.download_file("http://example.com/file.csv", str(file_path))
+        (tmp_path / "test_file.csv.part").write_bytes(b"stale")
+        self.downloader.download_file("http://example.com/file.csv", str(file_path))
         
-        assert file_path.exists()
         assert file_path.read_text() == "testcontent"
     
-    @patch.object(RentContractsDownloader, 'fetch_rent_contracts')
-    @patch.object(RentContractsDownloader, 'parse_html')
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.head')
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_download_file_parallel(self, mock_get, mock_head, tmp_path, monkeypatch):
+        """Test large files are fetched in byte ranges over several connections."""
+        content = bytes(range(256)) * 16
+        mock_head.return_value = Mock(headers={'accept-ranges': 'bytes', 'content-length': str(len(content))})
+        
+        def ranged_get(url, stream, timeout, headers):
+            # Offsets index the unencoded file, so ranges must not be gzipped
+            assert headers['Accept-Encoding'] == 'identity'
+            start, end = map(int, headers['Range'].removeprefix('bytes=').split('-'))
+            response = Mock(status_code=206)
+            response.iter_content.return_value = [content[start:end + 1]]
+            return response
+        mock_get.side_effect = ranged_get
+        
+        monkeypatch.setattr(self.downloader, 'min_part_size', 1024)
+        file_path = tmp_path / "test_file.csv"
+        self.downloader.download_file("http://example.com/file.csv", str(file_path))
+        
+        assert mock_head.call_args.kwargs['headers'] == {'Accept-Encoding': 'identity'}
+        assert mock_get.call_count == 4
+        assert file_path.read_bytes() == content
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test_file.csv"]
+    
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.head')
+    @patch('lib.extract.rent_contracts_downloader.requests.Session.get')
+    def test_download_file_parallel_interrupted_join(self, mock_get, mock_head, tmp_path, monkeypatch):
+        """Test a failed join leaves no file at the final path, only a resumable prefix."""
+        content = bytes(range(256)) * 16
+        mock_head.return_value = Mock(headers={'accept-ranges': 'bytes', 'content-length': str(len(content))})
+        
+        def ranged_get(url, stream, timeout, headers):
+            start, end = map(int, headers['Range'].removeprefix('bytes=').split('-'))
+            response = Mock(status_code=206)
+            response.iter_content.return_value = [content[start:end + 1]]
+            return response
+        mock_get.side_effect = ranged_get
+        
+        copyfileobj = shutil.copyfileobj
+        copies = []
+        
+        def fail_on_second_part(src, dst, length):
+            copies.append(src)
+            if len(copies) == 2:
+                raise OSError("No space left on device")
+            copyfileobj(src, dst, length)
+        
+        monkeypatch.setattr(self.downloader, 'min_part_size', 1024)
+        file_path = tmp_path / "test_file.csv"
+        with patch('lib.extract.rent_contracts_downloader.shutil.copyfileobj', side_effect=fail_on_second_part):
+            with pytest.raises(OSError):
+                self.downloader.download_file("http://example.com/file.csv", str(file_path))
+        
+        assert not file_path.exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test_file.csv.part"]
+        assert (tmp_path / "test_file.csv.part").read_bytes() == content[:1024]
+    
+    @patch.object(RentContractsDownloader, 'fetch_download_link')
     @patch.object(RentContractsDownloader, 'download_file')
-    def test_run_success(self, mock_download, mock_parse, mock_fetch, tmp_path):
+    def test_run_success(self, mock_download, mock_fetch_link, tmp_path):
         """Test successful run method."""
-        mock_fetch.return_value = b"<html>test</html>"
-        mock_parse.return_value = "download.csv"
+        mock_fetch_link.return_value = "download.csv"
         
         file_path = tmp_path / "output.csv"
         result = self.downloader.run(str(file_path))
         
         assert result is True
-        mock_fetch.assert_called_once()
-        mock_parse.assert_called_once_with(b"<html>test</html>")
+        mock_fetch_link.assert_called_once()
         mock_download.assert_called_once_with("download.csv", str(file_path))
     
-    @patch.object(RentContractsDownloader, 'fetch_rent_contracts')
-    @patch.object(RentContractsDownloader, 'parse_html')
-    def test_run_no_download_link(self, mock_parse, mock_fetch, tmp_path):
+    @patch.object(RentContractsDownloader, 'fetch_download_link')
+    def test_run_no_download_link(self, mock_fetch_link, tmp_path):
         """Test run method when no download link found."""
-        mock_fetch.return_value = b"<html>test</html>"
-        mock_parse.return_value = None
+        mock_fetch_link.return_value = None
         
         file_path = tmp_path / "output.csv"
         result = self.downloader.run(str(file_path))
@@ -176,11 +609,12 @@ class TestRentContractsDownloader:
 
 
 class TestRentContractsTransformer:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, transformer):
         """Setup for each test method."""
-        self.input_file = "test_input.csv"
-        self.output_file = "test_output.parquet"
-        self.transformer = RentContractsTransformer(self.input_file, self.output_file, validate=False)
+        self.input_file = transformer.input_file
+        self.output_file = transformer.output_file
+        self.transformer = transformer
     
     def test_init(self):
         """Test transformer initialization."""
@@ -188,25 +622,56 @@ class TestRentContractsTransformer:
         assert self.transformer.output_file == self.output_file
         assert self.transformer.validate is False
     
+    @patch('lib.transform.rent_contracts_transformer.os.replace')
     @patch('polars.scan_csv')
-    @patch('polars.DataFrame.write_parquet')
-    def test_transform_success(self, mock_write, mock_scan):
-        """Test successful transformation."""
+    def test_transform_success(self, mock_scan, mock_replace):
+        """Test the CSV is streamed to Parquet without being collected."""
         # Mock the lazy frame
         mock_lf = Mock()
         mock_scan.return_value = mock_lf
         
         # Mock the with_columns chain
         mock_lf.with_columns.return_value = mock_lf
-        mock_lf.head.return_value = mock_lf
-        mock_lf.collect.return_value = Mock()
         mock_lf.sink_parquet.return_value = None
         
         result = self.transformer.transform()
         
         assert result is True
         mock_scan.assert_called_once()
-        mock_lf.sink_parquet.assert_called_once()
+        # Written to a partial file, then renamed into place
+        mock_replace.assert_called_once_with(f"{self.output_file}.part", self.output_file)
+        mock_lf.sink_parquet.assert_called_once_with(
+            f"{self.output_file}.part",
+            compression='zstd',
+            compression_level=3,
+            row_group_size=100_000,
+            statistics=True,
+        )
+        assert not mock_lf.collect.called
+        
+        # The reader is given the dtypes up front instead of inferring them,
+        # and property_usage_en is dictionary-encoded before any grouping
+        schema_overrides = mock_scan.call_args.kwargs['schema_overrides']
+        assert schema_overrides['annual_amount'] == pl.Float64
+        assert schema_overrides['property_usage_en'] == pl.Categorical
+    
+    @patch('lib.transform.rent_contracts_transformer.os.replace')
+    @patch('polars.scan_csv')
+    def test_transform_streaming_config(self, mock_scan, mock_replace):
+        """Test the CSV reader is configured for low-memory streaming."""
+        mock_lf = Mock()
+        mock_scan.return_value = mock_lf
+        mock_lf.with_columns.return_value = mock_lf
+        
+        assert self.transformer.transform() is True
+        mock_scan.assert_called_once_with(
+            self.input_file,
+            null_values=["null", "NULL", ""],
+            encoding="utf8-lossy",
+            ignore_errors=True,
+            schema_overrides=CSV_SCHEMA_OVERRIDES,
+            low_memory=True,
+        )
     
     @patch('polars.scan_csv')
     def test_transform_file_not_found(self, mock_scan):
@@ -228,6 +693,89 @@ class TestRentContractsTransformer:
         
         assert result is False
     
+    def test_transform_interrupted_write(self, tmp_path):
+        """Test a failed write leaves neither a truncated output nor a partial file."""
+        csv_file = tmp_path / "rent_contracts.csv"
+        csv_file.write_text(
+            "contract_id,contract_start_date,contract_end_date,annual_amount,property_usage_en\n"
+            "1,01-01-2024,31-12-2024,50000,Residential\n"
+        )
+        output_file = tmp_path / "rent_contracts.parquet"
+        transformer = RentContractsTransformer(str(csv_file), str(output_file), validate=False)
+        
+        def partial_sink(self, path, **kwargs):
+            Path(path).write_bytes(b"PAR1 truncated")
+            raise pl.exceptions.ComputeError("worker killed")
+        
+        with patch.object(pl.LazyFrame, 'sink_parquet', partial_sink):
+            assert transformer.transform() is False
+        
+        assert list(tmp_path.iterdir()) == [csv_file]
+        
+        # A re-run writes the complete file
+        assert transformer.transform() is True
+        assert pl.read_parquet(output_file)['contract_id'].to_list() == [1]
+        assert not Path(f"{output_file}.part").exists()
+    
+    def test_transform_validation_sample_projection(self, tmp_path):
+        """Test the validation sample only materializes the validated columns."""
+        csv_file = tmp_path / "rent_contracts.csv"
+        csv_file.write_text(
+            "contract_id,contract_start_date,contract_end_date,annual_amount,property_usage_en,area_name_en,nearest_metro_en\n"
+            "1,01-01-2024,31-12-2024,50000,Residential,Dubai Marina,DMCC\n"
+        )
+        output_file = tmp_path / "rent_contracts.parquet"
+        transformer = RentContractsTransformer(str(csv_file), str(output_file), validate=True)
+        
+        with patch('lib.transform.rent_contracts_transformer.validate_rent_contracts',
+                   wraps=validate_rent_contracts) as mock_validate:
+            assert transformer.transform() is True
+        
+        sample = mock_validate.call_args[0][0]
+        assert set(sample.columns) == {
+            'contract_id', 'contract_start_date', 'contract_end_date', 'annual_amount', 'property_usage_en'
+        }
+        assert pl.read_parquet(output_file).width == 7
+    
+    def test_transform_schema_overrides(self, tmp_path):
+        """Test numeric and date columns get their declared dtypes, not inferred ones."""
+        csv_file = tmp_path / "rent_contracts.csv"
+        csv_file.write_text(
+            "contract_id,contract_start_date,contract_end_date,annual_amount,contract_amount,no_of_prop,property_usage_en\n"
+            "1,01-01-2024,31-12-2024,50000,50000,1,Residential\n"
+            "2,,,75000.5,,2,Commercial\n"
+        )
+        output_file = tmp_path / "rent_contracts.parquet"
+        transformer = RentContractsTransformer(str(csv_file), str(output_file))
+        
+        assert transformer.transform() is True
+        
+        schema = pl.read_parquet_schema(output_file)
+        assert schema['annual_amount'] == pl.Float64
+        assert schema['contract_amount'] == pl.Float64
+        assert schema['no_of_prop'] == pl.Int64
+        assert schema['contract_start_date'] == pl.Date
+        assert schema['contract_end_date'] == pl.Date
+        assert schema['property_usage_en'] == pl.Categorical
+    
+    def test_transform_sort_by(self, tmp_path):
+        """Test the output is clustered by the sort columns, nulls last."""
+        csv_file = tmp_path / "rent_contracts.csv"
+        csv_file.write_text(
+            "contract_id,contract_start_date,contract_end_date,annual_amount,area_id,property_usage_en\n"
+            "1,01-01-2024,31-12-2025,50000,7,Residential\n"
+            "2,01-01-2024,,60000,3,Residential\n"
+            "3,01-01-2024,31-12-2024,70000,9,Commercial\n"
+            "4,01-01-2024,31-12-2024,80000,2,Residential\n"
+        )
+        output_file = tmp_path / "rent_contracts.parquet"
+        transformer = RentContractsTransformer(
+            str(csv_file), str(output_file), validate=False, sort_by=['contract_end_date', 'area_id']
+        )
+        
+        assert transformer.transform() is True
+        assert pl.read_parquet(output_file)['contract_id'].to_list() == [4, 3, 1, 2]
+    
     def test_log_statistics(self):
         """Test statistics logging."""
         # Create test dataframe
@@ -236,8 +784,22 @@ class TestRentContractsTransformer:
             'property_usage_en': ['Residential', 'Commercial', 'Residential', 'Commercial']
         })
         
-        # This should not raise an exception
-        self.transformer._log_statistics(test_df)
+        with patch('lib.transform.rent_contracts_transformer.logger') as mock_logger:
+            self.transformer._log_statistics(test_df)
+        
+        messages = [c.args[0] for c in mock_logger.info.call_args_list]
+        mock_logger.warning.assert_not_called()
+        assert "Records with null rent: 1" in messages
+        assert "Rent range: AED 50,000 - 100,000" in messages
+        assert "Median rent: AED 75,000" in messages
+    
+    def test_log_statistics_skipped_when_info_disabled(self):
+        """Test statistics are not computed when INFO logging is disabled."""
+        with patch('lib.transform.rent_contracts_transformer.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            self.transformer._log_statistics(pl.DataFrame({'annual_amount': [50000]}))
+        
+        mock_logger.info.assert_not_called()
 
 
 class TestStarSchema:
@@ -262,13 +824,31 @@ class TestStarSchema:
         # Should return filtered dataframe
         assert result.height == 1
         assert result['area_name'][0] == 'Dubai Marina'
+        # The SQL is planned once at construction and reused
+        assert isinstance(self.star_schema._plan, pl.LazyFrame)
+        assert self.star_schema.transform_lazy() is self.star_schema._plan
+
+    def test_transform_lazy_input(self):
+        """Test StarSchema accepts a LazyFrame and materializes only the result."""
+        result = StarSchema(self.test_df.lazy(), self.test_query).transform()
+
+        assert isinstance(result, pl.DataFrame)
+        assert result['property_id'].to_list() == [1]
+
+    def test_transform_lazy(self):
+        """Test StarSchema can return the unexecuted query plan."""
+        plan = self.star_schema.transform_lazy()
+
+        assert isinstance(plan, pl.LazyFrame)
+        assert plan.collect().height == 1
 
 
 class TestPropertyUsage:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, property_usage):
         """Setup for each test method."""
-        self.output_file = "test_property_usage.csv"
-        self.property_usage = PropertyUsage(self.output_file)
+        self.output_file = property_usage.output
+        self.property_usage = property_usage
     
     @patch('polars.scan_parquet')
     def test_transform_success(self, mock_scan):
@@ -294,7 +874,6 @@ class TestPropertyUsage:
         mock_filtered.with_columns.return_value = mock_filtered  # Support with_columns chaining
         mock_filtered.group_by.return_value = mock_filtered
         mock_filtered.agg.return_value = mock_filtered
-        mock_filtered.collect.return_value = test_df
         
         # Mock collect_schema
         mock_schema = Mock()
@@ -302,8 +881,11 @@ class TestPropertyUsage:
         mock_lf.collect_schema.return_value = mock_schema
         
         # Mock write_csv
-        with patch.object(pl.DataFrame, 'write_csv'):
+        with patch.object(pl.DataFrame, 'write_csv'), \
+                patch('polars.collect_all', return_value=[test_df]) as mock_collect_all:
             self.property_usage.transform("test_input.parquet")
+        
+        mock_collect_all.assert_called_once_with([mock_filtered])
     
     @patch('polars.scan_parquet')
     def test_transform_with_area_data(self, mock_scan):
@@ -327,15 +909,11 @@ class TestPropertyUsage:
             'std_rent': [15000]
         })
         
-        # Prepare specific dataframes for joins
-        size_df = pl.DataFrame({
+        # Prepare the size/PSF dataframe for the join
+        area_df = pl.DataFrame({
             'property_usage_en': ['Residential'],
             'avg_area_sqft': [1000.0],
-            'median_area_sqft': [950.0]
-        })
-        
-        psf_df = pl.DataFrame({
-            'property_usage_en': ['Residential'],
+            'median_area_sqft': [950.0],
             'avg_psf': [50.0],
             'median_psf': [48.0]
         })
@@ -345,17 +923,123 @@ class TestPropertyUsage:
         mock_filtered.with_columns.return_value = mock_filtered  # Support with_columns chaining
         mock_filtered.group_by.return_value = mock_filtered
         mock_filtered.agg.return_value = mock_filtered
-        # Return main df first, then size stats, then psf stats
-        mock_filtered.collect.side_effect = [test_df, size_df, psf_df]
         
-        with patch.object(pl.DataFrame, 'write_csv'):
+        # Main stats and the combined size and psf stats come from one collect_all
+        with patch.object(pl.DataFrame, 'write_csv'), \
+                patch('polars.collect_all', return_value=[test_df, area_df]) as mock_collect_all:
             self.property_usage.transform("test_input.parquet")
+        
+        assert mock_collect_all.call_count == 1
+        assert len(mock_collect_all.call_args[0][0]) == 2
+        assert not mock_filtered.collect.called
+    
+    def test_transform_area_stats_nulls(self, tmp_path):
+        """Test rows without rent or area are left out of the matching statistics only."""
+        input_file = tmp_path / "rent_contracts.parquet"
+        pl.DataFrame({
+            'property_usage_en': ['Residential', 'Residential', 'Commercial'],
+            'annual_amount': [50000.0, None, 100000.0],
+            'actual_area': [1000.0, 500.0, None],
+        }).write_parquet(input_file)
+        output = tmp_path / "property_usage.csv"
+        
+        PropertyUsage(str(output)).transform(str(input_file))
+        
+        report = pl.read_csv(output).sort('property_usage_en')
+        assert report['no_of_contracts'].to_list() == [1, 1]
+        assert report['avg_area_sqft'].to_list() == [None, 750.0]
+        assert report['avg_psf'].to_list() == [None, 50.0]
+    
+    def test_transform_categorical_usage(self, tmp_path):
+        """Test area stats are joined onto the report when the usage column is Categorical."""
+        input_file = tmp_path / "rent_contracts.parquet"
+        pl.DataFrame({
+            'property_usage_en': ['Residential', 'Commercial', 'Residential'],
+            'annual_amount': [50000.0, 75000.0, 60000.0],
+            'actual_area': [1000.0, 1500.0, 1200.0],
+        }, schema_overrides={'property_usage_en': pl.Categorical}).write_parquet(input_file)
+        output = tmp_path / "property_usage.csv"
+        
+        PropertyUsage(str(output)).transform(str(input_file))
+        
+        report = pl.read_csv(output)
+        assert report['property_usage_en'].to_list() == ['Residential', 'Commercial']
+        assert report['avg_area_sqft'].to_list() == [1100.0, 1500.0]
+    
+    def test_transform_writes_parquet(self, tmp_path):
+        """Test a .parquet output path writes the report as zstd Parquet instead of CSV."""
+        input_file = tmp_path / "rent_contracts.parquet"
+        pl.DataFrame({
+            'property_usage_en': ['Residential', 'Commercial', 'Residential'],
+            'annual_amount': [50000.0, 75000.0, 60000.0],
+        }).write_parquet(input_file)
+        output_file = tmp_path / "property_usage.parquet"
+        
+        with patch.object(pl.DataFrame, 'write_parquet', autospec=True,
+                          side_effect=pl.DataFrame.write_parquet) as mock_write, \
+                patch.object(pl.DataFrame, 'write_csv') as mock_write_csv:
+            PropertyUsage(str(output_file)).transform(str(input_file))
+        
+        assert mock_write.call_args.kwargs['compression'] == 'zstd'
+        assert not mock_write_csv.called
+        report = pl.read_parquet(output_file)
+        assert report['property_usage_en'].to_list() == ['Residential', 'Commercial']
+        assert report['no_of_contracts'].to_list() == [2, 1]
+    
+    def test_transform_predicate_pushdown(self, tmp_path):
+        """Test the rent filter is pushed into the Parquet scan, not applied after it."""
+        input_file = tmp_path / "rent_contracts.parquet"
+        pl.DataFrame({
+            'property_usage_en': ['Residential', None, 'Commercial'] * 4,
+            'annual_amount': [50000.0, 60000.0, -1.0] * 4,
+            'area_name_en': ['Dubai Marina'] * 12,
+        }).write_parquet(input_file)
+        
+        plans = []
+        collect_all = pl.collect_all
+        
+        def capture_collect_all(lazy_frames, *args, **kwargs):
+            plans.extend(lf.explain(optimized=True) for lf in lazy_frames)
+            return collect_all(lazy_frames, *args, **kwargs)
+        
+        with patch('polars.collect_all', side_effect=capture_collect_all):
+            PropertyUsage(str(tmp_path / "property_usage.csv")).transform(str(input_file))
+        
+        scan = plans[0][plans[0].index("Parquet SCAN"):]
+        assert "SELECTION:" in scan
+        assert 'col("annual_amount") > 0.0' in scan
+    
+    def test_transform_projects_only_needed_columns(self, tmp_path):
+        """Test a wide input is scanned for only the columns the report reads."""
+        input_file = tmp_path / "rent_contracts.parquet"
+        pl.DataFrame({
+            'property_usage_en': ['Residential', 'Commercial', 'Residential'],
+            'annual_amount': [50000.0, 75000.0, 60000.0],
+            'actual_area': [1000.0, 1500.0, 800.0],
+            **{f'unused_{i}': [i] * 3 for i in range(47)},
+        }).write_parquet(input_file)
+        
+        plans = []
+        collect_all = pl.collect_all
+        
+        def capture_collect_all(lazy_frames, *args, **kwargs):
+            plans.extend(lf.explain(optimized=True) for lf in lazy_frames)
+            return collect_all(lazy_frames, *args, **kwargs)
+        
+        with patch('polars.collect_all', side_effect=capture_collect_all):
+            PropertyUsage(str(tmp_path / "property_usage.csv")).transform(str(input_file))
+        
+        assert len(plans) == 2
+        assert "PROJECT 2/50 COLUMNS" in plans[0]
+        assert "PROJECT 3/50 COLUMNS" in plans[1]
+        assert all("unused_" not in plan for plan in plans)
 
 
 class TestValidators:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, validator):
         """Setup for each test method."""
-        self.validator = RentContractValidator(strict_mode=False)
+        self.validator = validator
         
         # Create test dataframe with proper date types
         self.test_df = pl.DataFrame({
@@ -377,6 +1061,15 @@ class TestValidators:
         assert result.info == []
         assert result.is_valid is True
     
+    def test_validation_result_has_slots(self):
+        """Test ValidationResult instances carry no per-instance __dict__."""
+        from lib.classes.validators import ValidationResult
+        result = ValidationResult()
+        
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(AttributeError):
+            result.is_valid = False
+    
     def test_validation_result_add_error(self):
         """Test adding error to ValidationResult."""
         from lib.classes.validators import ValidationResult
@@ -431,10 +1124,22 @@ class TestValidators:
     
     def test_validate_rent_amounts(self):
         """Test rent amount validation."""
-        result = self.validator.validate_dataframe(self.test_df)
+        with patch.object(pl.LazyFrame, 'collect', autospec=True,
+                          side_effect=pl.LazyFrame.collect) as mock_collect:
+            result = self.validator.validate_dataframe(self.test_df)
         
         # Should detect negative rent
         assert any("rent <= 0" in error for error in result.errors)
+        # All rules are evaluated in a single pass
+        assert mock_collect.call_count == 1
+    
+    def test_validate_rent_amounts_zero_and_null(self):
+        """Test zero rents count as invalid while null rents are not counted."""
+        df = self.test_df.with_columns(pl.Series('annual_amount', [0.0, 75000.0, -1000.0, None]))
+        
+        result = self.validator.validate_dataframe(df)
+        
+        assert "Found 2 records with rent <= 0" in result.errors
     
     def test_validate_business_logic(self):
         """Test business logic validation."""
@@ -447,9 +1152,12 @@ class TestValidators:
             'annual_amount': [50000.0]
         })
         
-        result = self.validator.validate_dataframe(df_invalid_dates)
+        with patch.object(pl.LazyFrame, 'collect', autospec=True,
+                          side_effect=pl.LazyFrame.collect) as mock_collect:
+            result = self.validator.validate_dataframe(df_invalid_dates)
         
         assert any("end_date <= start_date" in error for error in result.errors)
+        assert mock_collect.call_count == 1
     
     def test_validate_rent_contracts_function(self):
         """Test convenience function."""
@@ -470,12 +1178,12 @@ class TestETLPipelineIntegration:
         self.property_usage_report = "test_property_usage.csv"
     
     @patch.dict(os.environ, {'DLD_URL': 'https://example.com/test'})
-    @patch('run_etl_pipeline.RentContractsDownloader')
-    @patch('run_etl_pipeline.RentContractsTransformer')
-    @patch('run_etl_pipeline.PropertyUsage')
-    @patch('run_etl_pipeline.GitHubRelease')
+    @patch('lib.extract.rent_contracts_downloader.RentContractsDownloader')
+    @patch('lib.transform.rent_contracts_transformer.RentContractsTransformer')
+    @patch('lib.classes.property_usage.PropertyUsage')
+    @patch('lib.workspace.github_client.GitHubRelease')
     def test_complete_pipeline_success(self, mock_github_class, mock_property_usage_class, 
-                                     mock_transformer_class, mock_downloader_class):
+                                     mock_transformer_class, mock_downloader_class, tmp_path, monkeypatch):
         """Test complete ETL pipeline execution."""
         # Setup mocks
 
@@ -490,17 +1198,78 @@ class TestETLPipelineIntegration:
         mock_publisher = Mock()
         mock_github_class.return_value = mock_publisher
         
-        # Import and run main function
-        with patch('run_etl_pipeline.os.path.isfile', return_value=False):
-            with patch('run_etl_pipeline.logger'):
-                from run_etl_pipeline import main
-                main()
+        # Run in an empty directory so no output/ files exist and the
+        # pipeline cannot touch a real download
+        monkeypatch.chdir(tmp_path)
+        with patch('run_etl_pipeline.logger'):
+            from run_etl_pipeline import main
+            main()
         
         # Verify all components were called
         mock_downloader.run.assert_called_once()
         mock_transformer.transform.assert_called_once()
         # mock_publisher.publish.assert_called_once()
     
+    def test_complete_pipeline_over_http(self, tmp_path, monkeypatch):
+        """Test the pipeline end to end against a local server sending a gzipped CSV."""
+        csv_bytes = (
+            b"contract_id,contract_start_date,contract_end_date,annual_amount,actual_area,area_id,property_usage_en\n"
+            b"1,01-03-2024,28-02-2025,65000,800,4,Residential\n"
+            b"2,01-01-2024,31-12-2024,50000,1000,7,Residential\n"
+            b"3,01-02-2024,31-01-2025,120000,1500,2,Commercial\n"
+        )
+        requests_seen = []
+        DLDHandler = dld_handler(csv_bytes, requests_seen)
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('GH_TOKEN', raising=False)
+        with serve_http(DLDHandler) as url:
+            monkeypatch.setenv('DLD_URL', url)
+            from run_etl_pipeline import main
+            main()
+        
+        assert [path for path, _ in requests_seen] == ["/", "/rent_contracts.csv"]
+        assert all("gzip" in accept_encoding for _, accept_encoding in requests_seen)
+        
+        date_str = date.today().strftime('%Y%m%d')
+        parquet = pl.read_parquet(tmp_path / "output" / f"rent_contracts_{date_str}.parquet")
+        assert parquet['contract_id'].to_list() == [1, 2, 3]
+        report = pl.read_csv(tmp_path / "output" / f"property_usage_{date_str}.csv")
+        assert dict(zip(report['property_usage_en'], report['no_of_contracts'])) == {'Residential': 2, 'Commercial': 1}
+        # The intermediate CSV is removed once the Parquet file is written
+        assert not (tmp_path / "output" / f"rent_contracts_{date.today().isoformat()}.csv").exists()
+    
+    def test_pipeline_reruns_after_interrupted_transform(self, tmp_path, monkeypatch):
+        """Test a Transform killed mid-write does not make the next run skip it."""
+        csv_bytes = (
+            b"contract_id,contract_start_date,contract_end_date,annual_amount,property_usage_en\n"
+            b"1,01-03-2024,28-02-2025,65000,Residential\n"
+            b"2,01-01-2024,31-12-2024,50000,Commercial\n"
+        )
+        requests_seen = []
+        date_str = date.today().strftime('%Y%m%d')
+        parquet_file = tmp_path / "output" / f"rent_contracts_{date_str}.parquet"
+        
+        def killed_sink(self, path, **kwargs):
+            Path(path).write_bytes(b"PAR1 truncated")
+            raise pl.exceptions.ComputeError("worker killed")
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('GH_TOKEN', raising=False)
+        with serve_http(dld_handler(csv_bytes, requests_seen)) as url:
+            monkeypatch.setenv('DLD_URL', url)
+            from run_etl_pipeline import main
+            with patch.object(pl.LazyFrame, 'sink_parquet', killed_sink):
+                main()
+            assert not parquet_file.exists()
+            
+            main()
+        
+        # The second run reuses the downloaded CSV and writes a complete Parquet
+        assert [path for path, _ in requests_seen] == ["/", "/rent_contracts.csv"]
+        assert pl.read_parquet(parquet_file)['contract_id'].to_list() == [1, 2]
+        assert (tmp_path / "output" / f"property_usage_{date_str}.csv").exists()
+    
 
     
     @patch.dict(os.environ, {}, clear=True)
@@ -512,42 +1281,109 @@ class TestETLPipelineIntegration:
         
         # Should log error and return early
     
-    def test_download_rent_contracts_file_exists(self):
+    @patch('lib.extract.rent_contracts_downloader.RentContractsDownloader')
+    def test_download_rent_contracts_file_exists(self, mock_downloader_class, tmp_path):
         """Test download function when file already exists."""
-        with patch('run_etl_pipeline.os.path.isfile', return_value=True):
-            with patch('run_etl_pipeline.logger'):
-                from run_etl_pipeline import download_rent_contracts
-                download_rent_contracts(self.test_url, self.csv_filename)
+        csv_file = tmp_path / self.csv_filename
+        csv_file.write_text("contract_id\n1\n")
+        
+        with patch('run_etl_pipeline.logger'):
+            from run_etl_pipeline import download_rent_contracts
+            assert download_rent_contracts(self.test_url, str(csv_file)) is True
+        
+        mock_downloader_class.assert_not_called()
     
-    @patch('run_etl_pipeline.RentContractsDownloader')
-    def test_download_rent_contracts_new_file(self, mock_downloader_class):
+    @patch('lib.extract.rent_contracts_downloader.RentContractsDownloader')
+    def test_download_rent_contracts_new_file(self, mock_downloader_class, tmp_path):
         """Test download function for new file."""
         mock_downloader = Mock()
         mock_downloader.run.return_value = True
         mock_downloader_class.return_value = mock_downloader
+        csv_file = str(tmp_path / self.csv_filename)
         
-        with patch('run_etl_pipeline.os.path.isfile', return_value=False):
-            with patch('run_etl_pipeline.logger'):
-                from run_etl_pipeline import download_rent_contracts
-                download_rent_contracts(self.test_url, self.csv_filename)
+        with patch('run_etl_pipeline.logger'):
+            from run_etl_pipeline import download_rent_contracts
+            download_rent_contracts(self.test_url, csv_file)
         
         mock_downloader_class.assert_called_once_with(self.test_url)
-        mock_downloader.run.assert_called_once_with(self.csv_filename)
+        mock_downloader.run.assert_called_once_with(csv_file)
+    
+    @patch('lib.transform.rent_contracts_transformer.RentContractsTransformer')
+    def test_transform_data_removes_input(self, mock_transformer_class, tmp_path):
+        """Test the intermediate CSV is deleted once the Parquet file is written."""
+        mock_transformer_class.return_value.transform.return_value = True
+        csv_file = tmp_path / self.csv_filename
+        csv_file.write_text("contract_id\n1\n")
+        
+        with patch('run_etl_pipeline.logger'):
+            from run_etl_pipeline import transform_data
+            assert transform_data(str(csv_file), str(tmp_path / self.parquet_filename), remove_input=True)
+        
+        assert not csv_file.exists()
+    
+    @patch('lib.transform.rent_contracts_transformer.RentContractsTransformer')
+    def test_transform_data_skips_existing_output(self, mock_transformer_class, tmp_path):
+        """Test transform is skipped when the Parquet output already exists."""
+        parquet_file = tmp_path / self.parquet_filename
+        parquet_file.write_bytes(b"PAR1")
+        
+        with patch('run_etl_pipeline.logger'):
+            from run_etl_pipeline import transform_data
+            assert transform_data(str(tmp_path / self.csv_filename), output_parquet=str(parquet_file)) is True
+        
+        mock_transformer_class.assert_not_called()
+    
+    @patch.dict(os.environ, {'DLD_URL': 'https://example.com/test'})
+    @patch('lib.extract.rent_contracts_downloader.RentContractsDownloader')
+    @patch('lib.transform.rent_contracts_transformer.RentContractsTransformer')
+    @patch('lib.classes.property_usage.PropertyUsage')
+    def test_pipeline_skips_existing_parquet(self, mock_property_usage_class,
+                                             mock_transformer_class, mock_downloader_class,
+                                             tmp_path, monkeypatch):
+        """Test Download and Transform are skipped when today's Parquet exists."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('GH_TOKEN', raising=False)
+        (tmp_path / "output").mkdir()
+        (tmp_path / "output" / f"rent_contracts_{date.today().strftime('%Y%m%d')}.parquet").write_bytes(b"PAR1")
+        
+        with patch('run_etl_pipeline.logger'):
+            from run_etl_pipeline import main
+            main()
+        
+        mock_downloader_class.assert_not_called()
+        mock_transformer_class.assert_not_called()
+        mock_property_usage_class.return_value.transform.assert_called_once()
     
     @patch.dict(os.environ, {'GH_TOKEN': 'test_token'})
-    @patch('run_etl_pipeline.GitHubRelease')
-    @patch('run_etl_pipeline.os.path.exists', return_value=True)
-    @patch('run_etl_pipeline.os.path.getsize', return_value=1024)
-    def test_publish_to_github_release_success(self, mock_getsize, mock_exists, mock_github_class):
+    @patch('lib.workspace.github_client.GitHubRelease')
+    def test_publish_to_github_release_success(self, mock_github_class, tmp_path):
         """Test successful GitHub publish function."""
         mock_publisher = Mock()
         mock_github_class.return_value = mock_publisher
         
-        test_files = [self.parquet_filename, self.property_usage_report]
+        test_files = [str(tmp_path / self.parquet_filename), str(tmp_path / self.property_usage_report)]
+        for f in test_files:
+            Path(f).write_bytes(b"x" * 1024)
         
         with patch('run_etl_pipeline.logger'):
             from run_etl_pipeline import publish_artifacts_to_github
-            publish_artifacts_to_github(test_files)
+            publish_artifacts_to_github(test_files + [str(tmp_path / "missing.csv")])
         
         mock_github_class.assert_called_once_with('dataengineergaurav/rental-market-dynamics-dubai')
         mock_publisher.publish.assert_called_once_with(files=test_files)
+    
+    @patch.dict(os.environ, {'GH_TOKEN': 'test_token'})
+    @patch('lib.workspace.github_client.GitHubRelease')
+    def test_publish_to_github_release_upload_failure(self, mock_github_class, tmp_path):
+        """Test a failed upload is not reported as a complete publication."""
+        mock_github_class.return_value.publish.return_value = False
+        test_file = tmp_path / self.parquet_filename
+        test_file.write_bytes(b"x")
+        
+        with patch('run_etl_pipeline.logger') as mock_logger:
+            from run_etl_pipeline import publish_artifacts_to_github
+            publish_artifacts_to_github([str(test_file)])
+        
+        messages = [c.args[0] for c in mock_logger.info.call_args_list]
+        assert "✓ GitHub publication complete!" not in messages
+        mock_logger.error.assert_called_once()